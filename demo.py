@@ -3,15 +3,19 @@
 Demo script showing OCI GenAI integration with LiteLLM.
 """
 
+import asyncio
 import os
 import sys
 
+import numpy as np
+
 # Add src to path for local development
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+from oci_genai_chatbot._kernels import row_norms
 from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
 
-def demo_chat():
+async def demo_chat():
     """Demonstrate chat functionality."""
     print("🤖 OCI GenAI Chat Demo")
     print("=" * 40)
@@ -41,14 +45,19 @@ def demo_chat():
             "Tell me a fun fact about Oracle Cloud."
         ]
         
-        for i, message in enumerate(test_messages, 1):
+        # Send all messages concurrently, then print the replies in order
+        responses = await asyncio.gather(
+            *(bot.achat(message) for message in test_messages),
+            return_exceptions=True
+        )
+        
+        for i, (message, response) in enumerate(zip(test_messages, responses), 1):
             print(f"\n👤 User {i}: {message}")
             
-            try:
-                response = bot.chat(message)
+            if isinstance(response, Exception):
+                print(f"❌ Error in chat {i}: {response}")
+            else:
                 print(f"🤖 Bot {i}: {response}")
-            except Exception as e:
-                print(f"❌ Error in chat {i}: {e}")
         
         print("\n✅ Chat demo completed!")
         
@@ -82,27 +91,29 @@ def demo_embedding():
             "LiteLLM makes AI integration easy."
         ]
         
-        for i, text in enumerate(test_texts, 1):
+        # Embed all texts in a single request
+        try:
+            embeddings = bot.embedding_batch(test_texts)
+        except Exception as e:
+            print(f"❌ Error generating embeddings: {e}")
+            return
+        
+        # Calculate all magnitudes at once
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        magnitudes = row_norms(vectors)
+        
+        for i, (text, embedding, magnitude) in enumerate(zip(test_texts, embeddings, magnitudes), 1):
             print(f"\n📝 Text {i}: {text}")
-            
-            try:
-                embedding = bot.embedding(text)
-                print(f"✅ Generated {len(embedding)}-dimensional embedding")
-                print(f"First 5 values: {embedding[:5]}")
-                
-                # Calculate magnitude
-                magnitude = sum(x**2 for x in embedding) ** 0.5
-                print(f"Magnitude: {magnitude:.6f}")
-                
-            except Exception as e:
-                print(f"❌ Error generating embedding {i}: {e}")
+            print(f"✅ Generated {len(embedding)}-dimensional embedding")
+            print(f"First 5 values: {embedding[:5]}")
+            print(f"Magnitude: {magnitude:.6f}")
         
         print("\n✅ Embedding demo completed!")
         
     except Exception as e:
         print(f"❌ Error in embedding demo: {e}")
 
-def main():
+async def main():
     """Run all demos."""
     print("🚀 OCI GenAI + LiteLLM Integration Demo")
     print("=" * 50)
@@ -125,7 +136,7 @@ def main():
     
     # Run demos
     try:
-        demo_chat()
+        await demo_chat()
         demo_embedding()
         
         print("\n🎉 All demos completed!")
@@ -134,10 +145,12 @@ def main():
         print("2. Launch web app: python run_streamlit.py")
         print("3. Explore the API in your own scripts")
         
-    except KeyboardInterrupt:
-        print("\n\n👋 Demo interrupted by user")
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # asyncio.run cancels the main task and re-raises here on Ctrl-C
+        print("\n\n👋 Demo interrupted by user")
\ No newline at end of file
@@ -44,19 +44,15 @@ def main():
         print(f"[cyan]>[/cyan] {command}")
         
         # Process command
-        if interface.process_command(command) == "exit":
+        result = interface.process_command(command)
+        if result == "exit":
             break
-        elif interface.process_command(command):
+        elif result:
             continue
         else:
             # Regular input - get response
             response = interface.stream_response(command)
-            interface.session_history.append({
-                "prompt": command,
-                "response": response,
-                "mode": interface.mode,
-                "timestamp": 0
-            })
+            interface.record_turn(command, response)
         
         print()
 
@@ -3,7 +3,6 @@
 Convenience script to run the Streamlit app.
 """
 
-import subprocess
 import sys
 import os
 
@@ -22,20 +21,20 @@ def main():
         print(f"Error: Streamlit app not found at {app_path}")
         sys.exit(1)
     
-    # Run streamlit
+    # Run streamlit in this interpreter instead of spawning a new one
+    from streamlit.web import cli as stcli
+    
+    sys.argv = [
+        "streamlit", "run", app_path,
+        "--server.headless", "false",
+        "--server.runOnSave", "true",
+        "--theme.base", "light"
+    ]
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", app_path,
-            "--server.headless", "false",
-            "--server.runOnSave", "true",
-            "--theme.base", "light"
-        ], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error running Streamlit: {e}")
-        sys.exit(1)
+        sys.exit(stcli.main())
     except KeyboardInterrupt:
         print("\nStreamlit app stopped.")
         sys.exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,8 +4,19 @@ OCI GenAI Chatbot - Sample application demonstrating LiteLLM integration with Or
 
 __version__ = "0.1.0"
 
-from .litellm_client import OCIGenAIChatBot
-from .cli import main as cli_main
-from .codex_cli import codex as codex_main
+__all__ = ["OCIGenAIChatBot", "cli_main", "codex_main"]
 
-__all__ = ["OCIGenAIChatBot", "cli_main", "codex_main"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Resolve the public API lazily so importing a submodule (or running
+    # `chatbot-cli --help`) doesn't pull in LiteLLM and the OCI SDK.
+    if name == "OCIGenAIChatBot":
+        from .litellm_client import OCIGenAIChatBot
+        return OCIGenAIChatBot
+    if name == "cli_main":
+        from .cli import main as cli_main
+        return cli_main
+    if name == "codex_main":
+        from .codex_cli import codex as codex_main
+        return codex_main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+"""
+Vector kernels for embedding math (norms and cosine similarity).
+
+When Numba is installed the loops are JIT-compiled (with the compiled code
+cached on disk to skip the cold compile on later runs); otherwise the
+equivalent NumPy reductions are used.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def norm(v):
+        """Return the L2 norm of a 1-D float array."""
+        s = 0.0
+        for i in range(v.shape[0]):
+            s += v[i] * v[i]
+        return math.sqrt(s)
+
+    @njit(cache=True, fastmath=True)
+    def row_norms(m):
+        """Return the L2 norm of every row of a 2-D float array."""
+        out = np.empty(m.shape[0], dtype=np.float64)
+        for r in range(m.shape[0]):
+            s = 0.0
+            for i in range(m.shape[1]):
+                s += m[r, i] * m[r, i]
+            out[r] = math.sqrt(s)
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def cosine(a, b):
+        """Return the cosine similarity of two 1-D float arrays."""
+        dot = 0.0
+        na = 0.0
+        nb = 0.0
+        for i in range(a.shape[0]):
+            dot += a[i] * b[i]
+            na += a[i] * a[i]
+            nb += b[i] * b[i]
+        if na == 0.0 or nb == 0.0:
+            return 0.0
+        return dot / math.sqrt(na * nb)
+
+else:
+    def norm(v):
+        """Return the L2 norm of a 1-D float array."""
+        return float(np.linalg.norm(v))
+
+    def row_norms(m):
+        """Return the L2 norm of every row of a 2-D float array."""
+        return np.linalg.norm(m, axis=1)
+
+    def cosine(a, b):
+        """Return the cosine similarity of two 1-D float arrays."""
+        denom = np.linalg.norm(a) * np.linalg.norm(b)
+        if denom == 0.0:
+            return 0.0
+        return float(np.dot(a, b) / denom)
@@ -4,17 +4,20 @@ Command-line interface for OCI GenAI Chatbot.
 
 import click
 import os
+from typing import TYPE_CHECKING
 from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.prompt import Prompt
-from rich.table import Table
-from rich.markdown import Markdown
 
-from oci_genai_chatbot.litellm_client import OCIGenAIChatBot, AVAILABLE_CHAT_MODELS, AVAILABLE_EMBEDDING_MODELS
+from oci_genai_chatbot.models import AVAILABLE_CHAT_MODELS, AVAILABLE_EMBEDDING_MODELS
+from oci_genai_chatbot.oci_config import OCI_CONFIG_FILE, load_oci_config
+
+if TYPE_CHECKING:
+    from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
 
 console = Console()
 
+# Chat-loop keywords that end the session
+_EXIT_CMDS = frozenset({"quit", "exit", "bye"})
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -37,8 +40,13 @@ def main():
               help="OCI compartment ID (defaults to OCI_COMPARTMENT_ID env var)")
 @click.option("--stream/--no-stream", default=True,
               help="Enable/disable streaming responses")
-def chat(model, temperature, max_tokens, system_prompt, compartment_id, stream):
+@click.option("--sim-cache-threshold", type=click.FloatRange(0.0, 1.0),
+              help="Reuse cached answers for prompts at least this similar (persisted across runs when hnswlib is installed)")
+def chat(model, temperature, max_tokens, system_prompt, compartment_id, stream, sim_cache_threshold):
     """Start an interactive chat session with OCI GenAI."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+    from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
     
     console.print(Panel.fit(
         "[bold blue]OCI GenAI Chatbot[/bold blue]\n"
@@ -55,7 +63,8 @@ def chat(model, temperature, max_tokens, system_prompt, compartment_id, stream):
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
-            compartment_id=compartment_id
+            compartment_id=compartment_id,
+            sim_cache_threshold=sim_cache_threshold
         )
         
         console.print("[green]✓[/green] Successfully connected to OCI GenAI")
@@ -75,16 +84,18 @@ def chat(model, temperature, max_tokens, system_prompt, compartment_id, stream):
                 # Get user input
                 user_input = Prompt.ask("[bold green]You[/bold green]")
                 
-                if user_input.lower() in ["quit", "exit", "bye"]:
+                command = user_input.lower()
+                
+                if command in _EXIT_CMDS:
                     console.print("\n[yellow]Goodbye! 👋[/yellow]")
                     break
                 
-                if user_input.lower() == "reset":
+                if command == "reset":
                     bot.reset_conversation()
                     console.print("[yellow]Conversation history cleared.[/yellow]\n")
                     continue
                 
-                if user_input.lower() == "history":
+                if command == "history":
                     _show_history(bot)
                     continue
                 
@@ -95,16 +106,17 @@ def chat(model, temperature, max_tokens, system_prompt, compartment_id, stream):
                 if stream:
                     # Streaming response
                     console.print("[bold blue]Bot:[/bold blue] ", end="")
-                    response_generator = bot.chat(user_input, system_prompt if system_prompt else None, stream=True)
+                    response_generator = bot.chat_stream(user_input, system_prompt if system_prompt else None)
                     
-                    full_response = ""
+                    # Write raw chunks straight to the terminal; going through
+                    # console.print would re-parse Rich markup for every token
+                    out = console.file
                     for chunk in response_generator:
                         if chunk.startswith("Error:"):
                             console.print(f"[red]{chunk}[/red]")
                             break
-                        else:
-                            full_response += chunk
-                            console.print(chunk, end="")
+                        out.write(chunk)
+                        out.flush()
                     
                     console.print("\n")  # Add newline after streaming
                 else:
@@ -129,38 +141,50 @@ def chat(model, temperature, max_tokens, system_prompt, compartment_id, stream):
         console.print("3. Verify OCI GenAI service access in your region")
 
 
-def _show_history(bot: OCIGenAIChatBot):
+def _show_history(bot: "OCIGenAIChatBot"):
     """Display conversation history."""
+    from rich.text import Text
+    
     history = bot.get_conversation_history()
     
     if not history:
         console.print("[yellow]No conversation history yet.[/yellow]\n")
         return
     
-    console.print("\n[bold]Conversation History:[/bold]")
+    # Assemble the whole transcript as one Text (explicit styles, no markup
+    # parsing) so it is rendered and flushed in a single print
+    transcript = Text.assemble(("\nConversation History:\n", "bold"))
     
-    for i, msg in enumerate(history):
+    for msg in history:
         role = "You" if msg["role"] == "user" else "Bot"
         color = "green" if msg["role"] == "user" else "blue"
-        console.print(f"[bold {color}]{role}:[/bold {color}] {msg['content']}")
+        transcript.append(f"{role}:", style=f"bold {color}")
+        transcript.append(f" {msg['content']}\n")
     
-    console.print()
+    console.print(transcript)
 
 
 @main.command()
-@click.argument("text")
+@click.argument("texts", nargs=-1, required=True)
 @click.option("--model", "-m", default="cohere.embed-multilingual-v3.0",
               help="OCI GenAI embedding model to use",
               type=click.Choice(AVAILABLE_EMBEDDING_MODELS))
 @click.option("--compartment-id", "-c",
               help="OCI compartment ID (defaults to OCI_COMPARTMENT_ID env var)")
-def embed(text, model, compartment_id):
-    """Generate embeddings for text using OCI GenAI."""
+def embed(texts, model, compartment_id):
+    """Generate embeddings for one or more TEXTS using OCI GenAI."""
+    import numpy as np
+    from rich.panel import Panel
+    from oci_genai_chatbot._kernels import row_norms
+    from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
     
+    preview = "\n".join(
+        f"Text: {text[:100]}{'...' if len(text) > 100 else ''}" for text in texts
+    )
     console.print(Panel.fit(
         f"[bold blue]Text Embedding[/bold blue]\n"
         f"Model: {model}\n"
-        f"Text: {text[:100]}{'...' if len(text) > 100 else ''}",
+        f"{preview}",
         title="🔢 Embedding Configuration"
     ))
     
@@ -168,27 +192,64 @@ def embed(text, model, compartment_id):
         # Initialize chatbot (for embedding functionality)
         bot = OCIGenAIChatBot(compartment_id=compartment_id)
         
-        with console.status("[bold blue]Generating embedding...", spinner="dots"):
-            embedding = bot.embedding(text, model)
+        with console.status("[bold blue]Generating embeddings...", spinner="dots"):
+            embeddings = bot.embedding_batch(list(texts), model)
         
-        console.print(f"[green]✓[/green] Generated {len(embedding)}-dimensional embedding")
+        # Calculate all magnitudes at once
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        magnitudes = row_norms(vectors)
         
-        # Show first and last few values
-        console.print("\n[bold]Embedding Vector (preview):[/bold]")
-        console.print(f"First 5 values: {embedding[:5]}")
-        console.print(f"Last 5 values: {embedding[-5:]}")
+        for text, embedding, magnitude in zip(texts, embeddings, magnitudes):
+            if len(texts) > 1:
+                console.print(f"\n[bold]Text:[/bold] {text[:100]}{'...' if len(text) > 100 else ''}")
+            
+            console.print(f"[green]✓[/green] Generated {len(embedding)}-dimensional embedding")
+            
+            # Show first and last few values
+            console.print("\n[bold]Embedding Vector (preview):[/bold]")
+            console.print(f"First 5 values: {embedding[:5]}")
+            console.print(f"Last 5 values: {embedding[-5:]}")
+            console.print(f"Magnitude: {magnitude:.6f}")
         
-        # Calculate magnitude
-        magnitude = sum(x**2 for x in embedding) ** 0.5
-        console.print(f"Magnitude: {magnitude:.6f}")
+        # Read the counters directly; stats() also walks the whole disk store
+        cache = bot.embedding_cache
+        console.print(f"\n[dim]Cache: {cache.hits} hits, {cache.misses} misses[/dim]")
+        cache.flush()
         
     except Exception as e:
         console.print(f"[red]Failed to generate embedding:[/red] {e}")
 
 
+@main.command(name="cache-stats")
+def cache_stats():
+    """Show embedding cache statistics."""
+    from rich.table import Table
+    from oci_genai_chatbot.embedding_cache import EmbeddingCache
+    
+    cache = EmbeddingCache()
+    stats = cache.stats()
+    
+    table = Table(title="🗄️ Embedding Cache")
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="white")
+    
+    lookups = stats["total_hits"] + stats["total_misses"]
+    hit_rate = f"{stats['total_hits'] / lookups:.1%}" if lookups else "n/a"
+    
+    table.add_row("Location", cache.cache_dir)
+    table.add_row("Cached embeddings", str(stats["disk_items"]))
+    table.add_row("Size on disk", f"{stats['disk_bytes'] / 1024:.1f} KiB")
+    table.add_row("Hits", str(stats["total_hits"]))
+    table.add_row("Misses", str(stats["total_misses"]))
+    table.add_row("Hit rate", hit_rate)
+    
+    console.print(table)
+
+
 @main.command()
 def models():
     """List available OCI GenAI models."""
+    from rich.table import Table
     
     # Chat models table
     chat_table = Table(title="💬 Available Chat Models")
@@ -228,12 +289,12 @@ def models():
 @main.command()
 def config():
     """Show OCI configuration status."""
+    from rich.panel import Panel
     
     console.print(Panel.fit("[bold blue]OCI Configuration Status[/bold blue]", title="⚙️ Configuration"))
     
     # Check OCI config file
-    config_file = os.path.expanduser("~/.oci/config")
-    if os.path.exists(config_file):
+    if os.path.exists(OCI_CONFIG_FILE):
         console.print("[green]✓[/green] OCI config file found at ~/.oci/config")
     else:
         console.print("[red]✗[/red] OCI config file not found at ~/.oci/config")
@@ -247,8 +308,7 @@ def config():
     
     # Try to load OCI config
     try:
-        import oci
-        config = oci.config.from_file()
+        config = load_oci_config()
         
         console.print("\n[bold]OCI Config Details:[/bold]")
         for key in ["user", "tenancy", "region"]:
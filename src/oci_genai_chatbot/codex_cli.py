@@ -3,48 +3,256 @@ Codex-inspired CLI interface for OCI GenAI Chatbot.
 A clean, developer-focused interface similar to OpenAI Codex.
 """
 
+import asyncio
+import itertools
+import json
 import os
+import queue
+import re
+import signal
 import sys
+import threading
 import click
-import readline
-from typing import Optional, Dict, Any, List
+from collections import deque
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Dict, Any, AsyncIterator, Deque, Iterator, List, Mapping
 from rich.console import Console
-from rich.text import Text
-from rich.syntax import Syntax
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.live import Live
-from rich.spinner import Spinner
 import time
 
-from oci_genai_chatbot.litellm_client import OCIGenAIChatBot, AVAILABLE_CHAT_MODELS
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only the lightweight model list is needed at import time; litellm_client
+# (and litellm itself) is imported when a session actually connects
+from oci_genai_chatbot.models import AVAILABLE_CHAT_MODELS
+
+if TYPE_CHECKING:
+    from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
 
 console = Console()
 
+# Splits text into word-sized chunks (leading whitespace kept with each word)
+_TOKEN_PATTERN = re.compile(r"\s*\S+|\s+")
+
+# Input history for the REPL (used with prompt_toolkit)
+HISTORY_FILE = os.path.expanduser("~/.oci_genai_history")
+
+# Completed turns of every session, one JSON object per line
+SESSION_HISTORY_FILE = os.path.expanduser("~/.oci_genai/history.jsonl")
+
+# Codex-style prompt, as prompt_toolkit formatted text
+_PROMPT = [("ansicyan", ">"), ("", " ")]
+
+# Fenced code blocks in a response: optional language tag, then the body. A tag
+# must end its line, so a one-line fence ("```x = 1```") is all body
+_CODE_FENCE = re.compile(r"```(?:([A-Za-z0-9_+-]*)\n)?(.*?)```", re.DOTALL)
+
+# Keywords that identify the language of an untagged code block, one group per
+# language (see _LANG_GROUPS). "from x import" is listed under Python so it wins
+# over SQL's FROM at the same position.
+_LANG_RE = re.compile(r"\b(?:(def |import |from [\w.]+ import )|(function |const )|((?i:select|from)\s))")
+_LANG_GROUPS = (None, "python", "javascript", "sql")
+
+# Codex-style system prompts, keyed by mode
+_SYSTEM_PROMPTS: Mapping[str, str] = MappingProxyType({
+    "suggest": "You are an AI coding assistant. Provide helpful suggestions and explanations for code. Always ask for confirmation before making changes.",
+    "code": "You are an expert programmer. Write clean, efficient code with clear explanations. Format code properly with syntax highlighting.",
+    "explain": "You are a technical documentation expert. Explain code, algorithms, and concepts clearly and concisely.",
+    "debug": "You are a debugging expert. Help identify and fix issues in code. Provide step-by-step debugging guidance.",
+    "review": "You are a code reviewer. Analyze code for best practices, potential issues, and improvement suggestions."
+})
+
+# Canned responses used by --demo, keyed by mode
+_DEMO_RESPONSES: Mapping[str, str] = MappingProxyType({
+    "code": """```python
+def hello_world():
+    \"\"\"A simple hello world function.\"\"\"
+    print("Hello, World!")
+    return "Hello, World!"
+
+# Usage
+if __name__ == "__main__":
+    greeting = hello_world()
+```
+
+This function prints and returns a greeting message. It's a classic example for demonstrating basic Python syntax.""",
+    
+    "explain": """This appears to be a request for code explanation. In demo mode, I would analyze your code and provide:
+
+• **Purpose**: What the code does
+• **Structure**: How it's organized  
+• **Key concepts**: Important programming principles
+• **Best practices**: Recommendations for improvement
+
+For a real analysis, please run without the --demo flag with proper OCI configuration.""",
+    
+    "debug": """**Debugging Approach:**
+
+1. **Identify the issue**: Reproduce the problem consistently
+2. **Check inputs**: Verify data types and values
+3. **Add logging**: Use print statements or debugger
+4. **Test incrementally**: Test small parts in isolation
+5. **Review logic**: Check conditional statements and loops
+
+In demo mode, I can't analyze your specific code, but this is the general debugging methodology I would apply.""",
+    
+    "review": """**Code Review Checklist:**
+
+✅ **Readability**: Clear variable names and comments
+✅ **Performance**: Efficient algorithms and data structures  
+✅ **Security**: Input validation and error handling
+✅ **Maintainability**: Modular design and documentation
+✅ **Standards**: Following language conventions
+
+For a detailed review of your specific code, please run without --demo flag.""",
+    
+    "suggest": """I'd be happy to help with that! In demo mode, I can show you the interface but can't provide actual AI responses.
+
+Some things I can help with when properly connected:
+• Code generation and optimization
+• Debugging and troubleshooting
+• Architecture and design patterns
+• Documentation and explanations
+• Code reviews and best practices
+
+Run without --demo to get real AI assistance!"""
+})
+
+
+# Tab completions for REPL commands, built once
+_COMPLETIONS = tuple(sorted([
+    "/help", "/mode", "/reset", "/history", "/exit", "/quit",
+    *(f"/mode {mode}" for mode in _SYSTEM_PROMPTS),
+]))
+
+
+def _guess_language(code: str) -> str:
+    """Guess the language of a code block from the first keyword that identifies one."""
+    match = _LANG_RE.search(code)
+    return _LANG_GROUPS[match.lastindex] if match else "text"
+
+
+def _json_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize entry as one UTF-8 JSON line, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+def _prompt_session():
+    """
+    Return a prompt_toolkit session with file-backed history, or None when
+    prompt_toolkit is not installed (the REPL then falls back to input()).
+    """
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.completion import WordCompleter
+        from prompt_toolkit.history import FileHistory
+    except ImportError:
+        return None
+    
+    # sentence=True matches the whole line, so "/mode c" completes to "/mode code"
+    completer = WordCompleter(list(_COMPLETIONS), ignore_case=True, sentence=True)
+    return PromptSession(history=FileHistory(HISTORY_FILE), completer=completer,
+                         complete_while_typing=False)
+
+
+def _preview(text: str, width: int = 60) -> str:
+    """Return text truncated to width characters for the /history listing."""
+    return text[:width] + "..." if len(text) > width else text
+
+
+def _tokenize(text: str) -> Iterator[str]:
+    """Yield word-sized chunks of text, as a stand-in for streamed tokens."""
+    for match in _TOKEN_PATTERN.finditer(text):
+        yield match.group()
+
+
+async def _demo_stream(text: str) -> AsyncIterator[str]:
+    """Yield text chunk by chunk with a short pause, simulating a model stream."""
+    for chunk in _tokenize(text):
+        yield chunk
+        await asyncio.sleep(0.02)
+
+
+class _HistoryAutosaver(threading.Thread):
+    """
+    Background thread that appends session turns to a JSONL file.
+    
+    The REPL only enqueues entries, so a turn never waits on disk I/O. The queue
+    is bounded; if the writer falls that far behind, new entries are dropped
+    from the file (they remain in the in-memory session history).
+    """
+    
+    def __init__(self, path: str = SESSION_HISTORY_FILE, maxsize: int = 1000):
+        super().__init__(name="history-autosaver", daemon=True)
+        self.path = path
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=maxsize)
+    
+    def save(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry for writing without blocking."""
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            pass
+    
+    def close(self, timeout: float = 2.0) -> None:
+        """Write out queued entries and stop the thread."""
+        self._queue.put(None)
+        self.join(timeout)
+    
+    def run(self) -> None:
+        while True:
+            entries = [self._queue.get()]
+            # Drain whatever else is queued so a burst costs one open()
+            while entries[-1] is not None:
+                try:
+                    entries.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = [_json_line(entry) for entry in entries if entry is not None]
+            if lines:
+                try:
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                    with open(self.path, "ab") as f:
+                        f.writelines(lines)
+                except OSError:
+                    # Persistence is best effort; the session itself is unaffected
+                    pass
+            
+            if entries[-1] is None:
+                return
+
+
 class CodexInterface:
     """Codex-inspired interface for OCI GenAI."""
     
+    # Read-only view shared by all instances
+    system_prompts = _SYSTEM_PROMPTS
+    
     def __init__(self, model: str = "cohere.command-r-plus", 
                  temperature: float = 0.7, max_tokens: int = 1000,
                  compartment_id: Optional[str] = None,
-                 mode: str = "suggest", demo: bool = False):
+                 mode: str = "suggest", demo: bool = False,
+                 live: Optional[bool] = None, render_final: bool = False):
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.compartment_id = compartment_id
         self.mode = mode
         self.demo = demo
-        self.bot: Optional[OCIGenAIChatBot] = None
-        self.session_history: List[Dict[str, Any]] = []
-        
-        # Codex-style system prompts
-        self.system_prompts = {
-            "suggest": "You are an AI coding assistant. Provide helpful suggestions and explanations for code. Always ask for confirmation before making changes.",
-            "code": "You are an expert programmer. Write clean, efficient code with clear explanations. Format code properly with syntax highlighting.",
-            "explain": "You are a technical documentation expert. Explain code, algorithms, and concepts clearly and concisely.",
-            "debug": "You are a debugging expert. Help identify and fix issues in code. Provide step-by-step debugging guidance.",
-            "review": "You are a code reviewer. Analyze code for best practices, potential issues, and improvement suggestions."
-        }
+        # Live Markdown rendering needs a terminal; fall back to plain output otherwise
+        self.live = console.is_terminal if live is None else live
+        # Without live rendering, optionally re-render the finished response as Markdown
+        self.render_final = render_final
+        self.bot: Optional["OCIGenAIChatBot"] = None
+        # Previews of recent turns for /history; the full log is written by the autosaver
+        self.session_history: Deque[Dict[str, Any]] = deque(maxlen=100)
+        self._autosaver: Optional[_HistoryAutosaver] = None
+        self._pending_input: Optional["asyncio.Future[str]"] = None
     
     def initialize(self) -> bool:
         """Initialize the OCI GenAI connection."""
@@ -53,12 +261,16 @@ class CodexInterface:
             return True
             
         try:
+            from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
+            
             self.bot = OCIGenAIChatBot(
                 model=self.model,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
                 compartment_id=self.compartment_id
             )
+            self._autosaver = _HistoryAutosaver()
+            self._autosaver.start()
             return True
         except Exception as e:
             console.print(f"[red]✗[/red] Failed to connect: {str(e)}")
@@ -76,9 +288,20 @@ class CodexInterface:
         console.print("[dim]Commands: /help, /mode, /reset, /exit[/dim]")
         console.print()
     
+    @property
+    def mode(self) -> str:
+        """Current interaction mode."""
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: str) -> None:
+        # Resolve the system prompt once per mode change rather than per turn
+        self._mode = mode
+        self._cached_system_prompt = _SYSTEM_PROMPTS.get(mode, _SYSTEM_PROMPTS["suggest"])
+    
     def get_system_prompt(self) -> str:
         """Get system prompt based on current mode."""
-        return self.system_prompts.get(self.mode, self.system_prompts["suggest"])
+        return self._cached_system_prompt
     
     def process_command(self, input_text: str) -> bool:
         """Process special commands. Returns True if command was handled."""
@@ -102,15 +325,15 @@ class CodexInterface:
             parts = command.split()
             if len(parts) > 1:
                 new_mode = parts[1]
-                if new_mode in self.system_prompts:
+                if new_mode in _SYSTEM_PROMPTS:
                     self.mode = new_mode
                     console.print(f"[dim]Mode changed to: {new_mode}[/dim]")
                 else:
                     console.print(f"[red]Unknown mode: {new_mode}[/red]")
-                    console.print(f"[dim]Available modes: {', '.join(self.system_prompts.keys())}[/dim]")
+                    console.print(f"[dim]Available modes: {', '.join(_SYSTEM_PROMPTS)}[/dim]")
             else:
                 console.print(f"[dim]Current mode: {self.mode}[/dim]")
-                console.print(f"[dim]Available modes: {', '.join(self.system_prompts.keys())}[/dim]")
+                console.print(f"[dim]Available modes: {', '.join(_SYSTEM_PROMPTS)}[/dim]")
             return True
         elif command == "history":
             self.show_history()
@@ -122,6 +345,8 @@ class CodexInterface:
     
     def show_help(self):
         """Show help information."""
+        from rich.panel import Panel
+        
         help_text = """[bold]Commands:[/bold]
   /help     Show this help
   /mode     Change interaction mode (suggest, code, explain, debug, review)
@@ -151,160 +376,217 @@ class CodexInterface:
             return
         
         console.print("\n[bold]Session History:[/bold]")
-        for i, entry in enumerate(self.session_history[-5:], 1):  # Show last 5
-            prompt_preview = entry['prompt'][:60] + "..." if len(entry['prompt']) > 60 else entry['prompt']
-            response_preview = entry['response'][:60] + "..." if len(entry['response']) > 60 else entry['response']
-            console.print(f"[dim]{i}.[/dim] [cyan]>[/cyan] {prompt_preview}")
-            console.print(f"   [green]<[/green] {response_preview}")
+        # Show last 5, oldest first
+        recent = reversed(list(itertools.islice(reversed(self.session_history), 5)))
+        for i, entry in enumerate(recent, 1):
+            console.print(f"[dim]{i}.[/dim] [cyan]>[/cyan] {entry['prompt_preview']}")
+            console.print(f"   [green]<[/green] {entry['response_preview']}")
         console.print()
     
+    def record_turn(self, prompt: str, response: str) -> None:
+        """
+        Add a completed turn to the session history and queue it for saving.
+        
+        Only previews are kept in memory; the full text goes to the history file.
+        """
+        timestamp = time.time()
+        self.session_history.append({
+            "prompt_preview": _preview(prompt),
+            "response_preview": _preview(response),
+            "mode": self.mode,
+            "timestamp": timestamp
+        })
+        if self._autosaver is not None:
+            self._autosaver.save({
+                "prompt": prompt,
+                "response": response,
+                "mode": self.mode,
+                "timestamp": timestamp
+            })
+    
     def format_response(self, response: str) -> None:
         """Format and display response with syntax highlighting."""
-        # Check if response contains code blocks
-        if "```" in response:
-            # Split by code blocks and render appropriately
-            parts = response.split("```")
-            for i, part in enumerate(parts):
-                if i % 2 == 0:
-                    # Regular text
-                    if part.strip():
-                        console.print(Markdown(part))
-                else:
-                    # Code block
-                    lines = part.strip().split('\n')
-                    if lines:
-                        # Try to detect language from first line
-                        first_line = lines[0]
-                        language = "text"
-                        code_content = part
-                        
-                        # Common language indicators
-                        if first_line in ["python", "py", "javascript", "js", "bash", "shell", "sql", "json", "yaml", "dockerfile"]:
-                            language = first_line
-                            code_content = '\n'.join(lines[1:])
-                        elif "def " in code_content or "import " in code_content:
-                            language = "python"
-                        elif "function " in code_content or "const " in code_content:
-                            language = "javascript"
-                        elif "SELECT " in code_content.upper() or "FROM " in code_content.upper():
-                            language = "sql"
-                        
-                        try:
-                            syntax = Syntax(code_content, language, theme="monokai", line_numbers=True)
-                            console.print(syntax)
-                        except:
-                            console.print(f"[dim]```{language}[/dim]")
-                            console.print(code_content)
-                            console.print("[dim]```[/dim]")
-        else:
-            # Regular markdown rendering
-            console.print(Markdown(response))
+        from rich.markdown import Markdown
+        from rich.syntax import Syntax
+        
+        # Render prose between code blocks as Markdown and each block with Syntax
+        pos = 0
+        for match in _CODE_FENCE.finditer(response):
+            prose = response[pos:match.start()]
+            if prose.strip():
+                console.print(Markdown(prose))
+            pos = match.end()
+            
+            language, code_content = match.groups()
+            code_content = code_content.strip("\n")
+            language = language or _guess_language(code_content)
+            
+            try:
+                syntax = Syntax(code_content, language, theme="monokai", line_numbers=True)
+                console.print(syntax)
+            except Exception:
+                console.print(f"[dim]```{language}[/dim]")
+                console.print(code_content)
+                console.print("[dim]```[/dim]")
+        
+        # Regular markdown rendering for whatever follows the last code block
+        prose = response[pos:]
+        if pos == 0 or prose.strip():
+            console.print(Markdown(prose))
     
     def stream_response(self, prompt: str) -> str:
         """Stream response with Codex-style formatting."""
+        return asyncio.run(self.astream_response(prompt))
+    
+    async def astream_response(self, prompt: str) -> str:
+        """Async version of stream_response, reading the model stream with litellm.acompletion."""
         console.print("[green]<[/green] ", end="")
         
         if self.demo:
             # Demo mode - provide sample responses
-            demo_responses = {
-                "code": """```python
-def hello_world():
-    \"\"\"A simple hello world function.\"\"\"
-    print("Hello, World!")
-    return "Hello, World!"
-
-# Usage
-if __name__ == "__main__":
-    greeting = hello_world()
-```
-
-This function prints and returns a greeting message. It's a classic example for demonstrating basic Python syntax.""",
-                
-                "explain": """This appears to be a request for code explanation. In demo mode, I would analyze your code and provide:
-
-• **Purpose**: What the code does
-• **Structure**: How it's organized  
-• **Key concepts**: Important programming principles
-• **Best practices**: Recommendations for improvement
-
-For a real analysis, please run without the --demo flag with proper OCI configuration.""",
-                
-                "debug": """**Debugging Approach:**
-
-1. **Identify the issue**: Reproduce the problem consistently
-2. **Check inputs**: Verify data types and values
-3. **Add logging**: Use print statements or debugger
-4. **Test incrementally**: Test small parts in isolation
-5. **Review logic**: Check conditional statements and loops
-
-In demo mode, I can't analyze your specific code, but this is the general debugging methodology I would apply.""",
-                
-                "review": """**Code Review Checklist:**
-
-✅ **Readability**: Clear variable names and comments
-✅ **Performance**: Efficient algorithms and data structures  
-✅ **Security**: Input validation and error handling
-✅ **Maintainability**: Modular design and documentation
-✅ **Standards**: Following language conventions
-
-For a detailed review of your specific code, please run without --demo flag.""",
-                
-                "suggest": """I'd be happy to help with that! In demo mode, I can show you the interface but can't provide actual AI responses.
-
-Some things I can help with when properly connected:
-• Code generation and optimization
-• Debugging and troubleshooting
-• Architecture and design patterns
-• Documentation and explanations
-• Code reviews and best practices
-
-Run without --demo to get real AI assistance!"""
-            }
+            response = _DEMO_RESPONSES.get(self.mode, _DEMO_RESPONSES["suggest"])
             
-            response = demo_responses.get(self.mode, demo_responses["suggest"])
-            
-            # Simulate streaming by printing character by character
-            for char in response:
-                console.print(char, end="")
-                time.sleep(0.01)  # Small delay to simulate streaming
-            
-            console.print("\n")
-            return response
+            if self.live:
+                return await self._render_live(_demo_stream(response))
+            return await self._write_plain(_demo_stream(response))
         
         system_prompt = self.get_system_prompt()
         
         try:
-            full_response = ""
-            response_generator = self.bot.chat(prompt, system_prompt, stream=True)
+            response_generator = await self.bot.achat(prompt, system_prompt, stream=True)
             
-            for chunk in response_generator:
-                if chunk.startswith("Error:"):
-                    console.print(f"[red]{chunk}[/red]")
-                    return chunk
-                else:
-                    full_response += chunk
-                    console.print(chunk, end="")
-            
-            console.print("\n")
-            return full_response
+            if self.live:
+                return await self._render_live(response_generator)
+            return await self._write_plain(response_generator)
             
         except Exception as e:
             error_msg = f"Error: {str(e)}"
             console.print(f"[red]{error_msg}[/red]")
             return error_msg
     
+    async def _write_plain(self, chunks: AsyncIterator[str]) -> str:
+        """
+        Write a response stream as raw text.
+        
+        Chunks are written straight to the console's file, skipping Rich's markup
+        parsing, and flushed at most every 50 ms. With render_final set, the
+        complete response is then rendered once with format_response.
+        """
+        out = console.file
+        parts: List[str] = []
+        last_flush = 0.0
+        
+        async for chunk in chunks:
+            if chunk.startswith("Error:"):
+                out.flush()
+                console.print(f"[red]{chunk}[/red]")
+                return chunk
+            
+            parts.append(chunk)
+            out.write(chunk)
+            now = time.monotonic()
+            if now - last_flush >= 0.05:
+                out.flush()
+                last_flush = now
+        
+        out.flush()
+        console.print("\n")
+        
+        full_response = "".join(parts)
+        if self.render_final:
+            self.format_response(full_response)
+        return full_response
+    
+    async def _render_live(self, chunks: AsyncIterator[str]) -> str:
+        """
+        Render a response stream as Markdown that updates in place.
+        
+        The Markdown is rebuilt at most ~10 times per second rather than once
+        per chunk, and the final frame is the fully rendered response.
+        """
+        from rich.live import Live
+        from rich.markdown import Markdown
+        from rich.text import Text
+        
+        parts: List[str] = []
+        last_update = 0.0
+        
+        with Live(Markdown(""), console=console, refresh_per_second=10,
+                  vertical_overflow="visible") as live:
+            async for chunk in chunks:
+                if not parts and chunk.startswith("Error:"):
+                    live.update(Text(chunk, style="red"))
+                    return chunk
+                
+                parts.append(chunk)
+                now = time.monotonic()
+                if now - last_update >= 0.1:
+                    live.update(Markdown("".join(parts)))
+                    last_update = now
+            
+            full_response = "".join(parts)
+            live.update(Markdown(full_response))
+        
+        console.print()
+        return full_response
+    
     def run_repl(self):
         """Run the main REPL loop."""
         if not self.initialize():
             return
         
         self.show_startup_banner()
+        try:
+            asyncio.run(self._run())
+        finally:
+            if self._autosaver is not None:
+                self._autosaver.close()
+    
+    async def _read_input(self, session) -> str:
+        """Read one line of input without blocking the event loop."""
+        if session is not None:
+            return await session.prompt_async(_PROMPT)
+        
+        # Codex-style prompt
+        console.print("[cyan]>[/cyan] ", end="")
+        
+        # A cancelled read leaves its thread blocked in input(), so the
+        # pending read is reused rather than starting a second one
+        if self._pending_input is None:
+            # run_in_executor rather than asyncio.to_thread, which needs 3.9
+            self._pending_input = asyncio.get_running_loop().run_in_executor(None, input)
+        try:
+            return await asyncio.shield(self._pending_input)
+        finally:
+            if self._pending_input.done():
+                self._pending_input = None
+    
+    async def _run(self):
+        """
+        Async REPL loop.
+        
+        Input is read in a worker thread so the event loop stays free to stream
+        and render responses, and Ctrl-C cancels the current turn (a slow first
+        token, a long stream) instead of killing the session.
+        """
+        task = asyncio.current_task()
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGINT, task.cancel)
+        except (NotImplementedError, RuntimeError):
+            # No loop signal handlers on this platform; Ctrl-C raises KeyboardInterrupt
+            pass
+        
+        session = _prompt_session()
+        if session is None:
+            try:
+                # Enables line editing and history for input()
+                import readline  # noqa: F401
+            except ImportError:
+                pass
         
         while True:
             try:
-                # Codex-style prompt
-                console.print("[cyan]>[/cyan] ", end="")
-                user_input = input().strip()
+                user_input = (await self._read_input(session)).strip()
                 
                 if not user_input:
                     continue
@@ -317,19 +599,17 @@ Run without --demo to get real AI assistance!"""
                     continue
                 
                 # Process regular input
-                response = self.stream_response(user_input)
+                response = await self.astream_response(user_input)
                 
                 # Store in history
-                self.session_history.append({
-                    "prompt": user_input,
-                    "response": response,
-                    "mode": self.mode,
-                    "timestamp": time.time()
-                })
+                self.record_turn(user_input, response)
                 
                 console.print()
                 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError) as e:
+                # Task.uncancel() is 3.11+; earlier versions keep no cancel count
+                if isinstance(e, asyncio.CancelledError) and hasattr(task, "uncancel"):
+                    task.uncancel()
                 console.print("\n[dim]Use /exit to quit[/dim]")
                 continue
             except EOFError:
@@ -349,7 +629,7 @@ Run without --demo to get real AI assistance!"""
 @click.option("--max-tokens", default=1000, type=int,
               help="Maximum tokens to generate")
 @click.option("--mode", default="suggest",
-              type=click.Choice(["suggest", "code", "explain", "debug", "review"]),
+              type=click.Choice(tuple(_SYSTEM_PROMPTS)),
               help="Interaction mode")
 @click.option("--compartment-id", "-c",
               help="OCI compartment ID")
@@ -357,7 +637,11 @@ Run without --demo to get real AI assistance!"""
               help="Execute a single command and exit")
 @click.option("--demo", is_flag=True,
               help="Run in demo mode (no OCI connection required)")
-def codex(model, temperature, max_tokens, mode, compartment_id, one_shot, demo):
+@click.option("--live/--no-live", default=True,
+              help="Render streamed Markdown live (ignored when not writing to a terminal)")
+@click.option("--render-final", is_flag=True,
+              help="Without live rendering, re-render each finished response as Markdown (always on for --one-shot)")
+def codex(model, temperature, max_tokens, mode, compartment_id, one_shot, demo, live, render_final):
     """
     oci-genai - Codex-inspired AI coding assistant
     
@@ -370,7 +654,9 @@ def codex(model, temperature, max_tokens, mode, compartment_id, one_shot, demo):
         max_tokens=max_tokens,
         compartment_id=compartment_id,
         mode=mode,
-        demo=demo
+        demo=demo,
+        live=live and console.is_terminal,
+        render_final=render_final or bool(one_shot)
     )
     
     if one_shot:
@@ -378,9 +664,8 @@ def codex(model, temperature, max_tokens, mode, compartment_id, one_shot, demo):
         if not interface.initialize():
             sys.exit(1)
         
-        response = interface.stream_response(one_shot)
-        if not response.startswith("Error:"):
-            interface.format_response(response)
+        # Streams the response, then renders it as Markdown (live or once at the end)
+        interface.stream_response(one_shot)
     else:
         # Interactive REPL mode
         interface.run_repl()
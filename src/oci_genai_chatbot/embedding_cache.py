@@ -0,0 +1,181 @@
+"""
+Content-addressed cache for OCI GenAI embeddings.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/oci_genai_embeddings")
+
+# Lifetime hit/miss counters, kept next to the shard directories
+STATS_FILE = "stats.json"
+
+# Caches whose counters are added to STATS_FILE when the interpreter exits
+_OPEN_CACHES: "weakref.WeakSet[EmbeddingCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches() -> None:
+    for cache in list(_OPEN_CACHES):
+        cache.flush()
+
+
+class EmbeddingCache:
+    """
+    Two-level embedding cache: an in-memory LRU in front of an on-disk store.
+
+    Embeddings are deterministic per (model, text), so entries are keyed by the
+    SHA-256 of both and never need invalidating. On disk each vector is kept as a
+    float32 ``.npy`` file, which is about half the size of the JSON floats.
+
+    A cache may be shared between threads (the Streamlit app shares one bot
+    across sessions): the LRU and the counters are guarded by a lock, which is
+    not held during disk I/O.
+
+    ``hits`` and ``misses`` count this instance's lookups. They are added to
+    lifetime totals in ``cache_dir``/stats.json on ``flush()`` and at exit, so
+    ``stats()`` in a later process still reports them.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_memory_items: int = 1024):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            cache_dir: Directory for the on-disk store
+            max_memory_items: Number of embeddings kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_items = max_memory_items
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Counter values already added to the stats file
+        self._flushed_hits = 0
+        self._flushed_misses = 0
+        _OPEN_CACHES.add(self)
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        """Return the cache key for a (model, text) pair."""
+        return hashlib.sha256(f"{model}:{text}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.npy")
+
+    def _remember(self, key: str, embedding: List[float]) -> None:
+        # Callers hold self._lock
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Return the cached embedding for text, or None on a miss."""
+        key = self.key(model, text)
+
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+        try:
+            embedding = np.load(self._path(key)).tolist()
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self._remember(key, embedding)
+            self.hits += 1
+        return embedding
+
+    def put(self, model: str, text: str, embedding: List[float]) -> None:
+        """Store an embedding in memory and on disk."""
+        key = self.key(model, text)
+        with self._lock:
+            self._remember(key, embedding)
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file first so readers never see a partial array
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.asarray(embedding, dtype=np.float32))
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk store is best effort; the in-memory copy is still usable
+            pass
+
+    @property
+    def _stats_path(self) -> str:
+        return os.path.join(self.cache_dir, STATS_FILE)
+
+    def _saved_totals(self) -> Dict[str, int]:
+        try:
+            with open(self._stats_path, "r") as f:
+                data = json.load(f)
+            return {"hits": int(data["hits"]), "misses": int(data["misses"])}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {"hits": 0, "misses": 0}
+
+    def flush(self) -> None:
+        """Add the hits and misses counted since the last flush to the lifetime totals on disk."""
+        with self._lock:
+            hits = self.hits - self._flushed_hits
+            misses = self.misses - self._flushed_misses
+        if not hits and not misses:
+            return
+
+        totals = self._saved_totals()
+        totals["hits"] += hits
+        totals["misses"] += misses
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(totals, f)
+            os.replace(tmp_path, self._stats_path)
+        except OSError:
+            # The counters are best effort, like the disk store
+            return
+
+        with self._lock:
+            self._flushed_hits += hits
+            self._flushed_misses += misses
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters (this instance's and lifetime) and the number of cached entries."""
+        disk_items = 0
+        disk_bytes = 0
+        if os.path.isdir(self.cache_dir):
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    if name.endswith(".npy"):
+                        disk_items += 1
+                        disk_bytes += os.path.getsize(os.path.join(root, name))
+
+        totals = self._saved_totals()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "total_hits": totals["hits"] + self.hits - self._flushed_hits,
+            "total_misses": totals["misses"] + self.misses - self._flushed_misses,
+            "memory_items": len(self._memory),
+            "disk_items": disk_items,
+            "disk_bytes": disk_bytes,
+        }
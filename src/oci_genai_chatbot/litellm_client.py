@@ -2,36 +2,120 @@
 LiteLLM client wrapper for OCI GenAI integration.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import logging
 import os
 import sys
-from typing import List, Dict, Any, Optional, Iterator, Union, AsyncIterator
+import time
+import weakref
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional, Iterator, Tuple, Union, AsyncIterator
 
-# Import LiteLLM with OCI GenAI support
-# This uses the forked version from https://github.com/djvolz/litellm
-try:
-    import litellm
-    
-    # Try to verify OCI GenAI support is available, but don't exit if not found
-    # This allows the module to be imported for testing purposes
-    OCI_GENAI_AVAILABLE = False
+from .embedding_cache import EmbeddingCache
+from .models import AVAILABLE_CHAT_MODELS, AVAILABLE_EMBEDDING_MODELS
+from .oci_config import load_oci_config
+from .similarity_cache import SimilarityCache
+
+logger = logging.getLogger(__name__)
+
+# LiteLLM model names for the catalog models, built once instead of per request
+_PREFIXED: Dict[str, str] = {
+    m: f"oci_genai/{m}" for m in AVAILABLE_CHAT_MODELS + AVAILABLE_EMBEDDING_MODELS
+}
+
+
+def _litellm_model(model: str) -> str:
+    """Return the LiteLLM name (with the oci_genai/ prefix) of an OCI GenAI model."""
+    return _PREFIXED.get(model) or f"oci_genai/{model}"
+
+@functools.lru_cache(maxsize=1)
+def _get_litellm():
+    """
+    Import LiteLLM on first use and return it, or None when it isn't installed.
+
+    LiteLLM takes several hundred milliseconds to import, so it is kept off the
+    import path of this module (and of the CLI and Streamlit app that import it)
+    until a bot is actually created. This uses the forked version from
+    https://github.com/djvolz/litellm with OCI GenAI support.
+    """
+    try:
+        import litellm
+    except ImportError as e:
+        print(f"Error importing litellm: {e}")
+        print("\nTo install LiteLLM with OCI GenAI support:")
+        print("1. pip install git+https://github.com/djvolz/litellm.git")
+        print("2. OR clone the repository and install locally:")
+        print("   git clone https://github.com/djvolz/litellm.git")
+        print("   cd litellm && pip install -e .")
+        return None
+    return litellm
+
+
+@functools.lru_cache(maxsize=1)
+def _oci_genai_available() -> bool:
+    """Return whether the installed LiteLLM has the OCI GenAI provider."""
     try:
         from litellm.types.utils import LlmProviders
-        if hasattr(LlmProviders, 'OCI_GENAI'):
-            OCI_GENAI_AVAILABLE = True
     except (ImportError, AttributeError):
-        # OCI GenAI support not available, but continue loading the module
-        pass
-        
-except ImportError as e:
-    print(f"Error importing litellm: {e}")
-    print("\nTo install LiteLLM with OCI GenAI support:")
-    print("1. pip install git+https://github.com/djvolz/litellm.git")
-    print("2. OR clone the repository and install locally:")
-    print("   git clone https://github.com/djvolz/litellm.git")
-    print("   cd litellm && pip install -e .")
-    # Don't exit here - allow the module to be imported
-    litellm = None
-    OCI_GENAI_AVAILABLE = False
+        return False
+    return hasattr(LlmProviders, 'OCI_GENAI')
+
+
+def __getattr__(name):
+    # Keep `litellm_client.litellm` working (e.g. for mock.patch targets)
+    # without importing LiteLLM at module load
+    if name == "litellm":
+        return _get_litellm()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_http_client() -> None:
+    """
+    Give litellm one shared keep-alive HTTP client, once per process, so later
+    requests reuse the connection to the OCI endpoint instead of paying a new
+    TCP + TLS handshake per call. A client_session set by the caller is kept.
+    """
+    litellm = _get_litellm()
+    if litellm.client_session is None:
+        import httpx  # installed with litellm
+        litellm.client_session = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=4),
+            timeout=60.0,
+        )
+
+
+# Routers are shared by every bot with the same model, compartment and timeout,
+# so a rebuilt bot (e.g. on a Streamlit rerun) reuses the existing router
+_ROUTER_CACHE: Dict[Tuple[str, Optional[str], float], Any] = {}
+
+
+def _get_router(model: str, compartment_id: Optional[str], timeout: float):
+    """
+    Return the litellm Router for a model, compartment and timeout, creating it on first use.
+    
+    The router resolves the deployment once and applies the per-attempt timeout,
+    one retry and a cooldown for a deployment that keeps failing. It is the only
+    retry layer, so a request makes at most two attempts.
+    """
+    key = (model, compartment_id, timeout)
+    router = _ROUTER_CACHE.get(key)
+    if router is None:
+        router = _get_litellm().Router(
+            model_list=[{
+                "model_name": model,
+                "litellm_params": {"model": model, "compartment_id": compartment_id},
+            }],
+            timeout=timeout,
+            num_retries=1,
+            allowed_fails=3,
+            cooldown_time=30,
+        )
+        _ROUTER_CACHE[key] = router
+    return router
 
 
 class OCIGenAIChatBot:
@@ -44,7 +128,13 @@ class OCIGenAIChatBot:
         model: str = "cohere.command-r-plus",
         temperature: float = 0.7,
         max_tokens: int = 500,
-        compartment_id: Optional[str] = None
+        compartment_id: Optional[str] = None,
+        cache_embeddings: bool = True,
+        sim_cache_threshold: Optional[float] = None,
+        stream_batch_ms: float = 66,
+        stream_batch_tokens: int = 50,
+        inflight_limit: Optional[int] = None,
+        request_timeout: float = 60.0
     ):
         """
         Initialize the OCI GenAI chatbot.
@@ -54,29 +144,58 @@ class OCIGenAIChatBot:
             temperature: Response randomness (0.0-1.0)
             max_tokens: Maximum tokens to generate
             compartment_id: OCI compartment ID (defaults to env var OCI_COMPARTMENT_ID)
+            cache_embeddings: Cache embeddings in memory and under ~/.cache/oci_genai_embeddings
+            sim_cache_threshold: Reuse the response of a previous prompt whose embedding has at
+                least this cosine similarity under the same model, sampling settings, system
+                prompt and conversation history (disabled when None)
+            stream_batch_ms: Streamed deltas are coalesced and yielded at most this often
+                (0 yields every delta as it arrives)
+            stream_batch_tokens: Yield early once this many deltas are waiting
+            inflight_limit: Maximum concurrent achat requests (defaults to env var
+                OCI_INFLIGHT_LIMIT, or 8)
+            request_timeout: Seconds each request attempt may take before the router
+                retries it once
         """
-        self.model = f"oci_genai/{model}"
+        self.model = _litellm_model(model)
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.stream_batch_ms = stream_batch_ms
+        self.stream_batch_tokens = stream_batch_tokens
+        self.request_timeout = request_timeout
         self.compartment_id = compartment_id or os.getenv("OCI_COMPARTMENT_ID")
-        self.conversation_history: List[Dict[str, str]] = []
+        # Bounds concurrent achat requests so bursts queue here instead of
+        # overloading the endpoint; a streaming request holds its slot until
+        # the stream is finished. The semaphores are made per event loop on
+        # first use (see _inflight): a bot is often built outside any loop, e.g.
+        # in a Streamlit script thread or before asyncio.run
+        self.inflight_limit = inflight_limit or int(os.getenv("OCI_INFLIGHT_LIMIT", "8"))
+        self._inflight_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Last 10 exchanges; the deque drops the oldest messages as new ones arrive
+        self.conversation_history: Deque[Dict[str, str]] = deque(maxlen=20)
+        self.embedding_cache: Optional[EmbeddingCache] = EmbeddingCache() if cache_embeddings else None
+        self.similarity_cache: Optional[SimilarityCache] = (
+            SimilarityCache(threshold=sim_cache_threshold) if sim_cache_threshold is not None else None
+        )
         
         # Validate OCI setup
         self._validate_oci_setup()
+        _configure_http_client()
+        self._router = _get_router(self.model, self.compartment_id, self.request_timeout)
     
     def _validate_oci_setup(self) -> None:
         """Validate that OCI configuration is available."""
         # Check if LiteLLM is available
-        if litellm is None:
+        if _get_litellm() is None:
             raise ValueError("LiteLLM is not available. Please install it with: pip install git+https://github.com/djvolz/litellm.git")
         
         # Check if OCI GenAI support is available (optional - show warning if not)
-        if not OCI_GENAI_AVAILABLE:
+        if not _oci_genai_available():
             print("Warning: OCI GenAI support not detected in LiteLLM. Make sure you're using the forked version.")
             
         try:
-            import oci
-            config = oci.config.from_file()
+            config = load_oci_config()
             required_keys = ["user", "tenancy", "fingerprint", "key_file", "region"]
             missing_keys = [key for key in required_keys if not config.get(key)]
             
@@ -101,44 +220,41 @@ class OCIGenAIChatBot:
         Returns:
             Bot response (string if stream=False, Iterator[str] if stream=True)
         """
-        # Build messages list
-        messages = []
-        
-        # Add system prompt if provided
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        # Answer from the similarity cache when a near-identical prompt was seen
+        prompt_vector = None
+        scope = self._similarity_scope(system_prompt)
+        if self.similarity_cache is not None:
+            prompt_vector, cached_response = self._similarity_lookup(message, scope)
+            if cached_response is not None:
+                self._remember(message, cached_response)
+                return iter([cached_response]) if stream else cached_response
         
-        # Add conversation history
-        messages.extend(self.conversation_history)
-        
-        # Add current user message
-        messages.append({"role": "user", "content": message})
+        # The message is only recorded in the history (via _remember) when the
+        # turn succeeds
+        messages = self._build_messages(message, system_prompt)
         
         try:
             # Make LiteLLM call to OCI GenAI
-            response = litellm.completion(
+            response = self._router.completion(
                 model=self.model,
                 messages=messages,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
-                compartment_id=self.compartment_id,
                 stream=stream,
             )
             
             if stream:
                 # Return streaming generator
-                return self._process_streaming_response(response, message)
+                return self._process_streaming_response(response, message, prompt_vector, scope)
             else:
                 # Extract response content
                 bot_response = response.choices[0].message.content
                 
-                # Update conversation history
-                self.conversation_history.append({"role": "user", "content": message})
-                self.conversation_history.append({"role": "assistant", "content": bot_response})
+                if prompt_vector is not None:
+                    self.similarity_cache.add(prompt_vector, bot_response, scope=scope)
                 
-                # Keep conversation history reasonable length (last 10 exchanges)
-                if len(self.conversation_history) > 20:
-                    self.conversation_history = self.conversation_history[-20:]
+                # Update conversation history
+                self._remember(message, bot_response)
                 
                 return bot_response
             
@@ -152,42 +268,109 @@ class OCIGenAIChatBot:
             else:
                 return error_message
     
-    def _process_streaming_response(self, response_stream, user_message: str) -> Iterator[str]:
+    def _build_messages(self, message: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+        """
+        Return a new request list: system prompt, conversation history, then the new message.
+        
+        The system message always comes first, so every turn starts with an identical
+        prefix that provider-side prompt caching can reuse. Changing the system prompt
+        (e.g. a codex mode switch) starts a new prefix. Per-turn context belongs in the
+        user message, never in the system prompt.
+        """
+        user = {"role": "user", "content": message}
+        if system_prompt:
+            return [{"role": "system", "content": system_prompt}, *self.conversation_history, user]
+        return [*self.conversation_history, user]
+    
+    def _remember(self, user_message: str, assistant_message: str) -> None:
+        """Record a completed exchange in the history."""
+        self.conversation_history.append({"role": "user", "content": user_message})
+        self.conversation_history.append({"role": "assistant", "content": assistant_message})
+    
+    def _similarity_scope(self, system_prompt: Optional[str]) -> str:
+        """
+        Return the similarity cache scope of a request: model, sampling settings,
+        system prompt and a digest of the conversation so far.
+        
+        The digest keeps a follow-up ("tell me more") from being answered with a
+        response cached in another conversation.
+        """
+        history = hashlib.sha256(json.dumps(list(self.conversation_history)).encode()).hexdigest()
+        return f"{self.model}|{self.temperature}|{self.max_tokens}|{history}|{system_prompt or ''}"
+    
+    def _similarity_lookup(self, message: str, scope: str):
+        """
+        Embed a prompt and look it up in the similarity cache, among prompts
+        sent in the same scope (see _similarity_scope).
+        
+        Returns:
+            (prompt embedding, cached response or None). The embedding is None
+            when the prompt could not be embedded, which disables caching for it.
+        """
+        try:
+            vector = self.embedding(message)
+        except Exception:
+            return None, None
+        return vector, self.similarity_cache.lookup(vector, scope=scope)
+    
+    def _process_streaming_response(self, response_stream, user_message: str,
+                                    prompt_vector: Optional[List[float]] = None,
+                                    scope: Optional[str] = None) -> Iterator[str]:
         """
         Process streaming response from LiteLLM.
         
         Args:
             response_stream: Streaming response from LiteLLM
             user_message: Original user message for history tracking
+            prompt_vector: Embedding of user_message to add to the similarity cache
+            scope: Similarity cache scope the response was generated in
             
         Yields:
             Response chunks as they arrive
         """
-        collected_response = ""
+        parts: List[str] = []
+        
+        # Deltas are yielded in batches (every stream_batch_ms, or sooner once
+        # stream_batch_tokens are waiting) to cut per-token overhead downstream;
+        # parts[flushed:] is the batch not yet yielded
+        flushed = 0
+        batch_window = self.stream_batch_ms / 1000
+        last_flush = time.monotonic()
         
         try:
             for chunk in response_stream:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-                    if hasattr(delta, 'content') and delta.content:
-                        content = delta.content
-                        collected_response += content
-                        yield content
-                    
-                    # Check if streaming is finished
-                    if chunk.choices[0].finish_reason:
-                        break
+                choices = chunk.choices
+                if not choices:
+                    continue
+                c0 = choices[0]
+                content = getattr(c0.delta, 'content', None)
+                if content:
+                    parts.append(content)
+                    now = time.monotonic()
+                    if len(parts) - flushed >= self.stream_batch_tokens or now - last_flush >= batch_window:
+                        yield "".join(parts[flushed:])
+                        flushed = len(parts)
+                        last_flush = now
+                
+                # Check if streaming is finished
+                if c0.finish_reason:
+                    break
+            
+            if flushed < len(parts):
+                yield "".join(parts[flushed:])
+                flushed = len(parts)
             
             # Update conversation history after streaming is complete
-            if collected_response:
-                self.conversation_history.append({"role": "user", "content": user_message})
-                self.conversation_history.append({"role": "assistant", "content": collected_response})
+            if parts:
+                collected_response = "".join(parts)
+                self._remember(user_message, collected_response)
                 
-                # Keep conversation history reasonable length (last 10 exchanges)
-                if len(self.conversation_history) > 20:
-                    self.conversation_history = self.conversation_history[-20:]
+                if prompt_vector is not None:
+                    self.similarity_cache.add(prompt_vector, collected_response, scope=scope)
                     
         except Exception as e:
+            if flushed < len(parts):
+                yield "".join(parts[flushed:])
             yield f"\n\nError during streaming: {str(e)}"
     
     def chat_stream(self, message: str, system_prompt: Optional[str] = None) -> Iterator[str]:
@@ -213,95 +396,140 @@ class OCIGenAIChatBot:
             stream: Whether to stream the response (default: False)
             
         Returns:
-            Bot response (string if stream=False, AsyncIterator[str] if stream=True)
+            Bot response (string if stream=False, AsyncIterator[str] if stream=True).
+            A returned stream holds an in-flight slot while it is being iterated.
         """
-        # Build messages list
-        messages = []
-        
-        # Add system prompt if provided
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+        messages = self._build_messages(message, system_prompt)
         
-        # Add conversation history
-        messages.extend(self.conversation_history)
+        if stream:
+            # Return async streaming generator; it takes its in-flight slot when
+            # iteration starts, so a stream closed or dropped unstarted holds none
+            return self._astream(messages, message)
         
-        # Add current user message
-        messages.append({"role": "user", "content": message})
-        
-        try:
-            # Make async LiteLLM call to OCI GenAI
-            response = await litellm.acompletion(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                compartment_id=self.compartment_id,
-                stream=stream,
-            )
-            
-            if stream:
-                # Return async streaming generator
-                return self._process_async_streaming_response(response, message)
-            else:
+        async with self._inflight():
+            try:
+                # The router times out and retries each attempt; this deadline
+                # covers both attempts and only stops a call that ignores it
+                deadline = 2 * self.request_timeout
+                try:
+                    response = await asyncio.wait_for(
+                        self._acompletion(messages, stream=False), timeout=deadline)
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"no response after {deadline}s")
+                
                 # Extract response content
                 bot_response = response.choices[0].message.content
                 
                 # Update conversation history
-                self.conversation_history.append({"role": "user", "content": message})
-                self.conversation_history.append({"role": "assistant", "content": bot_response})
-                
-                # Keep conversation history reasonable length (last 10 exchanges)
-                if len(self.conversation_history) > 20:
-                    self.conversation_history = self.conversation_history[-20:]
+                self._remember(message, bot_response)
                 
                 return bot_response
-            
-        except Exception as e:
-            error_message = f"Error: {str(e)}"
-            if stream:
+                
+            except Exception as e:
+                return f"Error: {str(e)}"
+    
+    def _inflight(self) -> asyncio.Semaphore:
+        """Return the in-flight semaphore of the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._inflight_by_loop.get(loop)
+        if semaphore is None:
+            semaphore = self._inflight_by_loop[loop] = asyncio.Semaphore(self.inflight_limit)
+        return semaphore
+    
+    def _acompletion(self, messages: List[Dict[str, str]], stream: bool):
+        """Return the awaitable async LiteLLM call to OCI GenAI for messages."""
+        return self._router.acompletion(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=stream,
+        )
+    
+    async def _astream(self, messages: List[Dict[str, str]], user_message: str) -> AsyncIterator[str]:
+        """
+        Make a streaming request and yield its response chunks.
+        
+        The in-flight slot is held from the first iteration until the stream
+        is exhausted, closed or garbage collected.
+        """
+        async with self._inflight():
+            started = time.monotonic()
+            try:
+                # Streams are paced by the model, so they get no overall deadline
+                response = await self._acompletion(messages, stream=True)
+            except Exception as e:
                 # Return error as a single chunk for async streaming
-                async def async_error_generator():
-                    yield error_message
-                return async_error_generator()
-            else:
-                return error_message
+                yield f"Error: {str(e)}"
+                return
+            
+            stream = self._process_async_streaming_response(response, user_message, started)
+            try:
+                async for text in stream:
+                    yield text
+            finally:
+                await stream.aclose()
+                # Close the upstream response too, so its connection is
+                # released before the slot is
+                aclose = getattr(response, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+                logger.debug("%s stream finished in %.3fs", self.model, time.monotonic() - started)
     
-    async def _process_async_streaming_response(self, response_stream, user_message: str) -> AsyncIterator[str]:
+    async def _process_async_streaming_response(self, response_stream, user_message: str,
+                                                started: float) -> AsyncIterator[str]:
         """
         Process async streaming response from LiteLLM.
         
         Args:
             response_stream: Async streaming response from LiteLLM
             user_message: Original user message for history tracking
+            started: time.monotonic() when the request was sent
             
         Yields:
             Response chunks as they arrive
         """
-        collected_response = ""
+        parts: List[str] = []
+        
+        # Deltas are yielded in batches (every stream_batch_ms, or sooner once
+        # stream_batch_tokens are waiting) to cut per-token overhead downstream;
+        # parts[flushed:] is the batch not yet yielded
+        flushed = 0
+        batch_window = self.stream_batch_ms / 1000
+        last_flush = time.monotonic()
         
         try:
             async for chunk in response_stream:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-                    if hasattr(delta, 'content') and delta.content:
-                        content = delta.content
-                        collected_response += content
-                        yield content
-                    
-                    # Check if streaming is finished
-                    if chunk.choices[0].finish_reason:
-                        break
+                choices = chunk.choices
+                if not choices:
+                    continue
+                c0 = choices[0]
+                content = getattr(c0.delta, 'content', None)
+                if content:
+                    if not parts:
+                        logger.debug("%s time to first token: %.3fs", self.model, time.monotonic() - started)
+                    parts.append(content)
+                    now = time.monotonic()
+                    if len(parts) - flushed >= self.stream_batch_tokens or now - last_flush >= batch_window:
+                        yield "".join(parts[flushed:])
+                        flushed = len(parts)
+                        last_flush = now
+                
+                # Check if streaming is finished
+                if c0.finish_reason:
+                    break
+            
+            if flushed < len(parts):
+                yield "".join(parts[flushed:])
+                flushed = len(parts)
             
             # Update conversation history after streaming is complete
-            if collected_response:
-                self.conversation_history.append({"role": "user", "content": user_message})
-                self.conversation_history.append({"role": "assistant", "content": collected_response})
-                
-                # Keep conversation history reasonable length (last 10 exchanges)
-                if len(self.conversation_history) > 20:
-                    self.conversation_history = self.conversation_history[-20:]
+            if parts:
+                self._remember(user_message, "".join(parts))
                     
         except Exception as e:
+            if flushed < len(parts):
+                yield "".join(parts[flushed:])
             yield f"\n\nError during async streaming: {str(e)}"
     
     async def achat_stream(self, message: str, system_prompt: Optional[str] = None) -> AsyncIterator[str]:
@@ -319,11 +547,16 @@ class OCIGenAIChatBot:
     
     def reset_conversation(self) -> None:
         """Reset the conversation history."""
-        self.conversation_history = []
+        self.conversation_history.clear()
     
-    def get_conversation_history(self) -> List[Dict[str, str]]:
-        """Get the current conversation history."""
-        return self.conversation_history.copy()
+    def get_conversation_history(self) -> Tuple[Dict[str, str], ...]:
+        """
+        Get a snapshot of the current conversation history.
+        
+        The tuple is not updated by later exchanges; its message dicts are shared
+        with the bot and must not be modified (copy with list() if needed).
+        """
+        return tuple(self.conversation_history)
     
     def embedding(self, text: str, model: str = "cohere.embed-multilingual-v3.0") -> List[float]:
         """
@@ -336,28 +569,78 @@ class OCIGenAIChatBot:
         Returns:
             Embedding vector
         """
+        return self.embedding_batch([text], model)[0]
+
+    def embedding_batch(self, texts: List[str], model: str = "cohere.embed-multilingual-v3.0",
+                        batch_size: int = 96) -> List[List[float]]:
+        """
+        Generate embeddings for several texts, batching them into as few OCI GenAI requests as possible.
+
+        Only texts missing from the embedding cache are sent to the API.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model name (without oci_genai/ prefix)
+            batch_size: Maximum texts per request (96 is the Cohere embed limit)
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        model_full = _litellm_model(model)
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        missing: List[int] = []
+        for i, text in enumerate(texts):
+            if self.embedding_cache is not None:
+                embeddings[i] = self.embedding_cache.get(model, text)
+            if embeddings[i] is None:
+                missing.append(i)
+        
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            try:
+                response = _get_litellm().embedding(
+                    model=model_full,
+                    input=[texts[i] for i in batch],
+                    compartment_id=self.compartment_id,
+                )
+            except Exception as e:
+                raise Exception(f"Embedding error: {str(e)}")
+            
+            for i, item in zip(batch, response.data):
+                embeddings[i] = item.embedding
+                if self.embedding_cache is not None:
+                    self.embedding_cache.put(model, texts[i], item.embedding)
+        
+        return embeddings
+
+    async def aembedding(self, text: str, model: str = "cohere.embed-multilingual-v3.0") -> List[float]:
+        """
+        Generate embeddings for text using OCI GenAI asynchronously.
+
+        Args:
+            text: Text to embed
+            model: Embedding model name (without oci_genai/ prefix)
+
+        Returns:
+            Embedding vector
+        """
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get(model, text)
+            if cached is not None:
+                return cached
+        
         try:
-            response = litellm.embedding(
-                model=f"oci_genai/{model}",
+            response = await _get_litellm().aembedding(
+                model=_litellm_model(model),
                 input=text,
                 compartment_id=self.compartment_id,
             )
-            
-            return response.data[0].embedding
-            
-        except Exception as e:
-            raise Exception(f"Embedding error: {str(e)}")
-
 
-# Available OCI GenAI models
-AVAILABLE_CHAT_MODELS = [
-    "cohere.command-r-plus",
-    "cohere.command-r", 
-    "meta.llama-3.1-405b-instruct",
-    "meta.llama-3.1-70b-instruct",
-]
+            embedding = response.data[0].embedding
 
-AVAILABLE_EMBEDDING_MODELS = [
-    "cohere.embed-multilingual-v3.0",
-    "cohere.embed-english-light-v3.0",
-]
\ No newline at end of file
+        except Exception as e:
+            raise Exception(f"Embedding error: {str(e)}")
+        
+        if self.embedding_cache is not None:
+            self.embedding_cache.put(model, text, embedding)
+        return embedding
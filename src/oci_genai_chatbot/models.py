@@ -0,0 +1,21 @@
+"""
+OCI GenAI model catalog.
+
+Kept free of heavy imports so the CLIs can build their option choices
+without loading LiteLLM.
+"""
+
+from typing import Tuple
+
+# Available OCI GenAI models (immutable so they can be shared safely)
+AVAILABLE_CHAT_MODELS: Tuple[str, ...] = (
+    "cohere.command-r-plus",
+    "cohere.command-r", 
+    "meta.llama-3.1-405b-instruct",
+    "meta.llama-3.1-70b-instruct",
+)
+
+AVAILABLE_EMBEDDING_MODELS: Tuple[str, ...] = (
+    "cohere.embed-multilingual-v3.0",
+    "cohere.embed-english-light-v3.0",
+)
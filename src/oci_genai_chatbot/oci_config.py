@@ -0,0 +1,21 @@
+"""
+Cached access to the local OCI SDK configuration.
+"""
+
+import functools
+import os
+from typing import Any, Dict
+
+# Default location read by oci.config.from_file()
+OCI_CONFIG_FILE = os.path.expanduser("~/.oci/config")
+
+
+@functools.lru_cache(maxsize=1)
+def load_oci_config() -> Dict[str, Any]:
+    """
+    Load and validate ~/.oci/config, parsing it at most once per process.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    import oci
+    return oci.config.from_file()
@@ -0,0 +1,209 @@
+"""
+Semantic cache for chat responses, keyed by prompt embeddings.
+"""
+
+import atexit
+import json
+import os
+import weakref
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/oci_genai_similarity")
+
+# Caches with unsaved entries are flushed when the interpreter exits
+_OPEN_CACHES: "weakref.WeakSet[SimilarityCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_caches() -> None:
+    for cache in list(_OPEN_CACHES):
+        cache.flush()
+
+
+class _FlatIndex:
+    """
+    Fixed-size in-memory index searched by brute force.
+
+    Vectors are stored L2-normalized in a float32 ring buffer, so a lookup is a
+    single matrix-vector product and the oldest entry is overwritten when full.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None
+        self._responses: List[str] = []
+        self._added = 0
+
+    def lookup(self, q: np.ndarray) -> Optional[Tuple[float, str]]:
+        """Return (similarity, response) of the nearest entry, or None if empty."""
+        if self._vectors is None or q.shape[0] != self._vectors.shape[1]:
+            return None
+        sims = self._vectors[:len(self._responses)] @ q
+        best = int(sims.argmax())
+        return float(sims[best]), self._responses[best]
+
+    def add(self, q: np.ndarray, response: str) -> None:
+        if self._vectors is None or q.shape[0] != self._vectors.shape[1]:
+            # First entry, or an embedding model with another dimension: start over
+            self._vectors = np.zeros((self.max_entries, q.shape[0]), dtype=np.float32)
+            self._responses = []
+            self._added = 0
+        slot = self._added % self.max_entries
+        self._vectors[slot] = q
+        if slot < len(self._responses):
+            self._responses[slot] = response
+        else:
+            self._responses.append(response)
+        self._added += 1
+
+
+class SimilarityCache:
+    """
+    Cache of chat responses looked up by prompt similarity.
+
+    A response is reused when a cached prompt with the same ``scope`` (the
+    model, sampling settings and system prompt it was answered under) has a
+    cosine similarity of at least ``threshold``. A vector whose dimension
+    differs from the cached ones never matches.
+
+    With hnswlib installed, prompt embeddings are stored in an HNSW index
+    (cosine space), so a lookup is an approximate nearest-neighbour query
+    instead of a scan over every cached prompt; the index and responses are
+    persisted to ``cache_dir`` every ``save_every`` inserts and at exit (or on
+    ``flush()``), and reloaded on the next run.
+    Without it, the most recent ``max_memory_entries`` prompts per scope are
+    kept in memory and searched by brute force.
+    """
+
+    def __init__(self, threshold: float = 0.97, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_elements: int = 10000, max_memory_entries: int = 256, save_every: int = 32):
+        """
+        Initialize the similarity cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            cache_dir: Directory the index and responses are persisted to (hnswlib only)
+            max_elements: Initial index capacity (grown automatically; hnswlib only)
+            max_memory_entries: Entries kept per scope without hnswlib (oldest evicted first)
+            save_every: Inserts between writes of the index to disk (hnswlib only)
+        """
+        self.threshold = threshold
+        self.cache_dir = cache_dir
+        self.max_elements = max_elements
+        self.max_memory_entries = max_memory_entries
+        self.save_every = save_every
+        self._index = None
+        self._responses: List[str] = []
+        self._scopes: List[Optional[str]] = []
+        # Entries per scope, so a lookup in an empty scope skips the index
+        self._scope_counts: Counter = Counter()
+        self._unsaved = 0
+        self._flat: Dict[Optional[str], _FlatIndex] = {}
+        if hnswlib is not None:
+            self._load()
+            _OPEN_CACHES.add(self)
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, "index.bin")
+
+    @property
+    def _responses_path(self) -> str:
+        return os.path.join(self.cache_dir, "responses.json")
+
+    def _load(self) -> None:
+        """Load a previously persisted index, if any."""
+        try:
+            with open(self._responses_path, "r") as f:
+                data = json.load(f)
+            index = hnswlib.Index(space="cosine", dim=data["dim"])
+            index.load_index(self._index_path, max_elements=max(self.max_elements, len(data["responses"])))
+        except (OSError, ValueError, KeyError, RuntimeError):
+            return
+
+        self._index = index
+        self._responses = data["responses"]
+        # Entries saved before scopes were recorded belong to the default scope
+        self._scopes = data.get("scopes", [None] * len(self._responses))
+        self._scope_counts = Counter(self._scopes)
+
+    def _save(self) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._index.save_index(self._index_path)
+        with open(self._responses_path, "w") as f:
+            json.dump({"dim": self._index.dim, "responses": self._responses, "scopes": self._scopes}, f)
+
+    def flush(self) -> None:
+        """Write entries added since the last save to ``cache_dir``."""
+        if not self._unsaved:
+            return
+        try:
+            self._save()
+        except OSError:
+            # Persistence is best effort; the in-memory index is still valid
+            return
+        self._unsaved = 0
+
+    def lookup(self, vector: Sequence[float], scope: Optional[str] = None) -> Optional[str]:
+        """Return the cached response for the most similar prompt in scope, or None."""
+        vector = np.asarray(vector, dtype=np.float32)
+
+        if hnswlib is None:
+            index = self._flat.get(scope)
+            norm = np.linalg.norm(vector)
+            hit = index.lookup(vector / norm) if index is not None and norm else None
+            if hit is not None and hit[0] >= self.threshold:
+                return hit[1]
+            return None
+
+        if self._index is None or not self._scope_counts[scope] or vector.shape[0] != self._index.dim:
+            return None
+
+        try:
+            labels, distances = self._index.knn_query(
+                vector, k=1, filter=lambda label: self._scopes[label] == scope)
+        except RuntimeError:
+            return None
+        # hnswlib's cosine "distance" is 1 - cosine similarity
+        if 1.0 - distances[0][0] >= self.threshold:
+            return self._responses[labels[0][0]]
+        return None
+
+    def add(self, vector: Sequence[float], response: str, scope: Optional[str] = None) -> None:
+        """Cache response under the embedding of its prompt."""
+        vector = np.asarray(vector, dtype=np.float32)
+
+        if hnswlib is None:
+            norm = np.linalg.norm(vector)
+            if norm:
+                if scope not in self._flat:
+                    self._flat[scope] = _FlatIndex(self.max_memory_entries)
+                self._flat[scope].add(vector / norm, response)
+            return
+
+        if self._index is None or vector.shape[0] != self._index.dim:
+            # First entry, or an embedding model with another dimension: start over
+            self._index = hnswlib.Index(space="cosine", dim=vector.shape[0])
+            self._responses = []
+            self._scopes = []
+            self._scope_counts.clear()
+            self._index.init_index(max_elements=self.max_elements, ef_construction=200, M=16)
+        elif self._index.get_current_count() >= self._index.get_max_elements():
+            self._index.resize_index(2 * self._index.get_max_elements())
+
+        self._index.add_items(vector[np.newaxis, :], np.asarray([len(self._responses)]))
+        self._responses.append(response)
+        self._scopes.append(scope)
+        self._scope_counts[scope] += 1
+
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.flush()
@@ -2,12 +2,55 @@
 Streamlit web application for OCI GenAI Chatbot.
 """
 
+import itertools
+import json
 import streamlit as st
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, Any
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from oci_genai_chatbot._kernels import norm
 from oci_genai_chatbot.litellm_client import OCIGenAIChatBot, AVAILABLE_CHAT_MODELS, AVAILABLE_EMBEDDING_MODELS
+from oci_genai_chatbot.oci_config import OCI_CONFIG_FILE, load_oci_config
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to JSON bytes: indented with orjson, compact otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Pretty-printing dominates json.dumps cost on large float lists
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Settings that need a new chatbot; the others are applied to the existing one
+_CLIENT_KEYS = ("model", "compartment_id")
+
+# Runs blocking OCI calls off the script thread so they can be bounded by a timeout
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Seconds to wait for the connection test reply
+_CONNECTION_TEST_TIMEOUT = 30
+
+# Position of each chat model in the selectbox, looked up on every rerun
+_CHAT_MODEL_INDEX = {m: i for i, m in enumerate(AVAILABLE_CHAT_MODELS)}
+
+
+@st.cache_resource(show_spinner=False)
+def _get_embedding_bot(compartment_id: str) -> OCIGenAIChatBot:
+    """
+    Return the bot used by the embedding page, shared across reruns and sessions.
+    
+    Only embeddings are requested from it, so no conversation state is shared.
+    """
+    return OCIGenAIChatBot(compartment_id=compartment_id)
 
 
 def init_session_state():
@@ -37,7 +80,7 @@ def sidebar_config():
     model = st.sidebar.selectbox(
         "Select Model",
         AVAILABLE_CHAT_MODELS,
-        index=AVAILABLE_CHAT_MODELS.index(st.session_state.config["model"])
+        index=_CHAT_MODEL_INDEX[st.session_state.config["model"]]
     )
     
     # Temperature slider
@@ -93,11 +136,11 @@ def sidebar_config():
         "compartment_id": compartment_id
     }
     
-    config_changed = new_config != st.session_state.config
+    client_changed = any(new_config[key] != st.session_state.config[key] for key in _CLIENT_KEYS)
     st.session_state.config = new_config
     
-    # Initialize/reinitialize chatbot if config changed
-    if config_changed or st.session_state.chatbot is None:
+    # Initialize/reinitialize chatbot if the model or compartment changed
+    if client_changed or st.session_state.chatbot is None:
         if compartment_id:
             try:
                 with st.spinner("Initializing chatbot..."):
@@ -114,6 +157,11 @@ def sidebar_config():
         else:
             st.sidebar.warning("⚠️ Please enter your OCI Compartment ID")
             st.session_state.chatbot = None
+    else:
+        # Generation settings apply from the next request on; the system prompt
+        # is passed with each message. The conversation is kept.
+        st.session_state.chatbot.temperature = temperature
+        st.session_state.chatbot.max_tokens = max_tokens
     
     # Control buttons
     st.sidebar.markdown("---")
@@ -135,9 +183,26 @@ def test_connection():
             st.sidebar.error("❌ Chatbot not initialized")
             return
         
+        # Probe with a throwaway bot of the same settings: a timed-out request
+        # keeps running on the worker thread, and must not touch (or leave its
+        # greeting in) the session bot's history
+        bot = st.session_state.chatbot
+        probe = OCIGenAIChatBot(
+            model=bot.model.partition("/")[2],
+            temperature=bot.temperature,
+            max_tokens=bot.max_tokens,
+            compartment_id=bot.compartment_id,
+            cache_embeddings=False,
+        )
+        
         with st.sidebar.container():
             with st.spinner("Testing connection..."):
-                response = st.session_state.chatbot.chat("Hello! Please respond with just 'Hi'.")
+                future = _EXECUTOR.submit(probe.chat, "Hello! Please respond with just 'Hi'.")
+                try:
+                    response = future.result(timeout=_CONNECTION_TEST_TIMEOUT)
+                except FutureTimeoutError:
+                    st.sidebar.error(f"❌ Connection timed out after {_CONNECTION_TEST_TIMEOUT}s")
+                    return
             
             if "error" in response.lower():
                 st.sidebar.error(f"❌ Connection failed: {response}")
@@ -190,25 +255,18 @@ def main_chat_interface():
                     
                     if enable_streaming:
                         # Streaming response
-                        response_placeholder = st.empty()
-                        full_response = ""
+                        stream_generator = st.session_state.chatbot.chat_stream(prompt, system_prompt)
                         
-                        # Get streaming response
-                        stream_generator = st.session_state.chatbot.chat(prompt, system_prompt, stream=True)
-                        
-                        for chunk in stream_generator:
-                            if chunk.startswith("Error:"):
-                                st.error(chunk)
-                                st.session_state.messages.append({"role": "assistant", "content": chunk})
-                                break
-                            else:
-                                full_response += chunk
-                                # Update the placeholder with the accumulated response
-                                response_placeholder.markdown(full_response + "▎")  # Add cursor
+                        # A failed request yields a single "Error: ..." chunk, so
+                        # look at the first chunk before rendering the stream
+                        with st.spinner("Thinking..."):
+                            first_chunk = next(stream_generator, "")
                         
-                        # Remove cursor and finalize
-                        if not full_response.startswith("Error:"):
-                            response_placeholder.markdown(full_response)
+                        if first_chunk.startswith("Error:"):
+                            st.error(first_chunk)
+                            st.session_state.messages.append({"role": "assistant", "content": first_chunk})
+                        else:
+                            full_response = st.write_stream(itertools.chain([first_chunk], stream_generator))
                             st.session_state.messages.append({"role": "assistant", "content": full_response})
                     
                     else:
@@ -258,10 +316,11 @@ def embedding_page():
     if st.button("Generate Embedding", type="primary", disabled=not text_input or not compartment_id):
         try:
             with st.spinner("Generating embedding..."):
-                # Initialize chatbot for embedding
-                bot = OCIGenAIChatBot(compartment_id=compartment_id)
+                bot = _get_embedding_bot(compartment_id)
                 embedding = bot.embedding(text_input, embedding_model)
             
+            magnitude = float(norm(np.asarray(embedding, dtype=np.float32)))
+            
             st.success(f"✅ Generated {len(embedding)}-dimensional embedding")
             
             # Display embedding information
@@ -269,7 +328,7 @@ def embedding_page():
             
             with col1:
                 st.metric("Dimensions", len(embedding))
-                st.metric("Magnitude", f"{sum(x**2 for x in embedding) ** 0.5:.6f}")
+                st.metric("Magnitude", f"{magnitude:.6f}")
             
             with col2:
                 st.write("**First 10 values:**")
@@ -279,20 +338,19 @@ def embedding_page():
                 st.json(embedding[-10:])
             
             # Download option
-            import json
             embedding_data = {
                 "text": text_input,
                 "model": embedding_model,
                 "embedding": embedding,
                 "metadata": {
                     "dimensions": len(embedding),
-                    "magnitude": sum(x**2 for x in embedding) ** 0.5
+                    "magnitude": magnitude
                 }
             }
             
             st.download_button(
                 "📥 Download Embedding",
-                data=json.dumps(embedding_data, indent=2),
+                data=_dumps(embedding_data),
                 file_name=f"embedding_{int(time.time())}.json",
                 mime="application/json"
             )
@@ -310,8 +368,7 @@ def config_page():
     st.subheader("📋 OCI Configuration Status")
     
     # Check OCI config file
-    config_file = os.path.expanduser("~/.oci/config")
-    if os.path.exists(config_file):
+    if os.path.exists(OCI_CONFIG_FILE):
         st.success("✅ OCI config file found at ~/.oci/config")
     else:
         st.error("❌ OCI config file not found at ~/.oci/config")
@@ -327,8 +384,7 @@ def config_page():
     
     # Try to load OCI config
     try:
-        import oci
-        config = oci.config.from_file()
+        config = load_oci_config()
         
         st.subheader("🔧 OCI Config Details")
         
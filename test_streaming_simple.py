@@ -1,210 +0,0 @@
-#!/usr/bin/env python3
-"""
-Simple test to verify chatbot streaming implementation structure.
-"""
-
-import sys
-import inspect
-
-# Test the source file directly
-def test_litellm_client_structure():
-    """Test that the litellm client has streaming support."""
-    print("Testing litellm_client.py file structure...")
-    
-    with open('src/oci_genai_chatbot/litellm_client.py', 'r') as f:
-        content = f.read()
-    
-    # Check for streaming-related methods and imports
-    streaming_features = {
-        'Iterator': 'Iterator import for streaming types',
-        'AsyncIterator': 'AsyncIterator import for async streaming',
-        'def chat(': 'Main chat method',
-        'stream: bool = False': 'Stream parameter in chat method',
-        'def chat_stream(': 'Convenience streaming method',
-        'def achat(': 'Async chat method',
-        'def achat_stream(': 'Async streaming method',
-        '_process_streaming_response': 'Streaming response processor',
-        '_process_async_streaming_response': 'Async streaming response processor',
-        'stream=stream': 'Stream parameter passing to LiteLLM',
-        'for chunk in response_stream': 'Stream iteration logic',
-        'async for chunk in response_stream': 'Async stream iteration logic',
-    }
-    
-    missing_features = []
-    for feature, description in streaming_features.items():
-        if feature not in content:
-            missing_features.append(f"  ✗ {description}")
-        else:
-            print(f"  ✓ {description}")
-    
-    if missing_features:
-        print("\nMissing features:")
-        for feature in missing_features:
-            print(feature)
-        return False
-    else:
-        print("✓ All streaming features found in litellm_client.py")
-        return True
-
-def test_streamlit_app_structure():
-    """Test that the Streamlit app has streaming support."""
-    print("\nTesting streamlit_app.py file structure...")
-    
-    with open('src/oci_genai_chatbot/streamlit_app.py', 'r') as f:
-        content = f.read()
-    
-    # Check for streaming-related features
-    streaming_features = {
-        '"enable_streaming"': 'Streaming configuration option',
-        'Enable Streaming': 'Streaming toggle in UI',
-        'stream=True': 'Streaming parameter usage',
-        'response_placeholder': 'Streaming response placeholder',
-        'full_response += chunk': 'Chunk accumulation logic',
-        'stream_generator': 'Streaming generator variable',
-        'for chunk in stream_generator': 'Stream iteration in UI',
-        'Streaming:': 'Streaming status display',
-    }
-    
-    missing_features = []
-    for feature, description in streaming_features.items():
-        if feature not in content:
-            missing_features.append(f"  ✗ {description}")
-        else:
-            print(f"  ✓ {description}")
-    
-    if missing_features:
-        print("\nMissing features:")
-        for feature in missing_features:
-            print(feature)
-        return False
-    else:
-        print("✓ All streaming features found in streamlit_app.py")
-        return True
-
-def test_cli_structure():
-    """Test that the CLI has streaming support."""
-    print("\nTesting cli.py file structure...")
-    
-    with open('src/oci_genai_chatbot/cli.py', 'r') as f:
-        content = f.read()
-    
-    # Check for streaming-related features
-    streaming_features = {
-        '--stream/--no-stream': 'CLI streaming option',
-        'default=True': 'Streaming enabled by default',
-        'help="Enable/disable streaming responses"': 'Streaming help text',
-        'if stream:': 'Streaming conditional logic',
-        'response_generator = bot.chat': 'Streaming response handling',
-        'for chunk in response_generator': 'CLI stream iteration',
-        'print(chunk, end="")': 'Real-time chunk output',
-        'Streaming mode: responses will appear in real-time': 'Streaming mode help',
-    }
-    
-    missing_features = []
-    for feature, description in streaming_features.items():
-        if feature not in content:
-            missing_features.append(f"  ✗ {description}")
-        else:
-            print(f"  ✓ {description}")
-    
-    if missing_features:
-        print("\nMissing features:")
-        for feature in missing_features:
-            print(feature)
-        return False
-    else:
-        print("✓ All streaming features found in cli.py")
-        return True
-
-def test_readme_documentation():
-    """Test that README has streaming documentation."""
-    print("\nTesting README.md documentation...")
-    
-    with open('README.md', 'r') as f:
-        content = f.read()
-    
-    # Check for streaming documentation
-    streaming_docs = {
-        'Real-time Streaming': 'Streaming feature highlight',
-        '--stream': 'CLI streaming option documentation',
-        '--no-stream': 'CLI non-streaming option documentation',
-        'chat_stream': 'Streaming method documentation',
-        'achat_stream': 'Async streaming method documentation',
-        'stream=True': 'LiteLLM streaming parameter',
-        'Real-time streaming': 'Streaming feature description',
-        'Streaming Toggle': 'UI streaming toggle documentation',
-        'async for chunk': 'Async streaming example',
-    }
-    
-    missing_docs = []
-    for doc, description in streaming_docs.items():
-        if doc not in content:
-            missing_docs.append(f"  ✗ {description}")
-        else:
-            print(f"  ✓ {description}")
-    
-    if missing_docs:
-        print("\nMissing documentation:")
-        for doc in missing_docs:
-            print(doc)
-        return False
-    else:
-        print("✓ All streaming documentation found in README.md")
-        return True
-
-def main():
-    """Run all structure tests."""
-    print("=" * 60)
-    print("OCI GenAI Chatbot Streaming Implementation Verification")
-    print("=" * 60)
-    
-    tests = [
-        test_litellm_client_structure,
-        test_streamlit_app_structure,
-        test_cli_structure,
-        test_readme_documentation,
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} failed: {e}")
-    
-    print("\n" + "=" * 60)
-    print(f"Structure Verification: {passed}/{total} components verified")
-    
-    if passed == total:
-        print("🎉 All streaming features successfully implemented!")
-        print("\n✨ Summary of streaming capabilities added:")
-        print("  📱 Streamlit Web App:")
-        print("    • Real-time streaming toggle in sidebar")
-        print("    • Live response streaming with cursor")
-        print("    • Streaming status indicators")
-        print("  💻 Command Line Interface:")
-        print("    • --stream/--no-stream options")
-        print("    • Real-time character-by-character output")
-        print("    • Streaming mode indicators")
-        print("  🔧 Python API:")
-        print("    • chat(stream=True) for streaming responses")
-        print("    • chat_stream() convenience method")
-        print("    • achat() and achat_stream() for async streaming")
-        print("    • Full async/await support")
-        print("  📚 Documentation:")
-        print("    • Updated README with streaming examples")
-        print("    • API usage examples for all streaming modes")
-        print("    • Feature highlights and benefits")
-    else:
-        print(f"⚠️  {total - passed} components need review.")
-    
-    print("=" * 60)
-    
-    return passed == total
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Shared pytest fixtures for the OCI GenAI Chatbot tests.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+from unittest.mock import Mock
+
+import pytest
+
+# Repository root (this file lives in tests/)
+ROOT = Path(__file__).parent.parent
+
+# The package is not installable (there is no pyproject.toml), so the tests
+# import it straight from src
+sys.path.insert(0, str(ROOT / "src"))
+
+
+def pytest_configure(config):
+    """Register markers."""
+    # Deselect with: pytest -m "not slow"
+    config.addinivalue_line("markers", "slow: tests that import heavy dependencies (litellm, oci, streamlit)")
+
+
+# Files whose contents are checked by the structure tests, relative to ROOT
+SOURCE_FILES = (
+    "src/oci_genai_chatbot/streamlit_app.py",
+    "src/oci_genai_chatbot/cli.py",
+    "README.md",
+)
+
+
+@pytest.fixture(scope="session")
+def file_sources() -> Dict[str, str]:
+    """Contents of SOURCE_FILES keyed by relative path, read once per session."""
+    return {path: (ROOT / path).read_text(encoding="utf-8") for path in SOURCE_FILES}
+
+
+# Keys the chatbot requires in ~/.oci/config
+OCI_REQUIRED_KEYS = ("user", "tenancy", "fingerprint", "key_file", "region")
+
+
+@pytest.fixture(scope="session")
+def oci_config(request) -> Dict[str, Optional[str]]:
+    """
+    The required keys of ~/.oci/config. Tests using it are skipped when the file
+    doesn't exist, and fail when it can't be parsed.
+
+    The parsed values are kept in pytest's cache (.pytest_cache) together with
+    the file's mtime, so the OCI SDK only parses the file again after it changes.
+    """
+    from oci_genai_chatbot.oci_config import OCI_CONFIG_FILE
+
+    try:
+        mtime = os.stat(OCI_CONFIG_FILE).st_mtime
+    except OSError:
+        pytest.skip(f"no OCI config at {OCI_CONFIG_FILE}")
+
+    cache = request.config.cache
+    cached = cache.get("oci_genai_chatbot/oci_config", None)
+    if cached and cached["mtime"] == mtime:
+        return cached["value"]
+
+    oci = pytest.importorskip("oci")
+    try:
+        config = oci.config.from_file(OCI_CONFIG_FILE)
+    except Exception as e:
+        pytest.fail(f"can't load OCI config {OCI_CONFIG_FILE}: {e}")
+
+    value = {key: config.get(key) for key in OCI_REQUIRED_KEYS}
+    cache.set("oci_genai_chatbot/oci_config", {"mtime": mtime, "value": value})
+    return value
+
+
+def _clear_client_caches() -> None:
+    """Forget the litellm module, HTTP client setup and routers cached by litellm_client."""
+    from oci_genai_chatbot import litellm_client
+
+    litellm_client._get_litellm.cache_clear()
+    litellm_client._oci_genai_available.cache_clear()
+    litellm_client._configure_http_client.cache_clear()
+    litellm_client._ROUTER_CACHE.clear()
+
+
+@pytest.fixture
+def mock_heavy_deps(monkeypatch):
+    """
+    Replace litellm and the OCI SDK with mocks for the duration of one test.
+
+    Not autouse: test_setup.py checks the real packages, so only tests that
+    must never reach them (see test_streaming.py) request it. The caches in
+    litellm_client are cleared on both sides, so no mock outlives its test.
+    """
+    monkeypatch.setitem(sys.modules, "litellm", Mock())
+    monkeypatch.setitem(sys.modules, "oci", Mock())
+    _clear_client_caches()
+    yield
+    _clear_client_caches()
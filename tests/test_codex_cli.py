@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test script for the Codex-style CLI interface.
+"""
+
+import functools
+import os
+import sys
+import subprocess
+from importlib.metadata import entry_points
+from typing import Tuple
+from unittest.mock import patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from oci_genai_chatbot.cli import main as chatbot_cli
+from oci_genai_chatbot import codex_cli
+from oci_genai_chatbot.codex_cli import CodexInterface, _HistoryAutosaver, _guess_language, codex
+
+# Subprocesses run from src so they import the same package when it isn't installed
+SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'src')
+
+# Expected outputs; regenerate with UPDATE_SNAPSHOTS=1 pytest tests/
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), 'snapshots')
+
+# Commands are invoked in-process rather than in a new interpreter
+runner = CliRunner()
+
+@functools.lru_cache(maxsize=32)
+def _run_cli(argv: Tuple[str, ...], cwd: str = SRC_DIR) -> subprocess.CompletedProcess:
+    """Run argv in a fresh interpreter, at most once per command line per session."""
+    return subprocess.run(list(argv), capture_output=True, text=True, cwd=cwd)
+
+def _assert_snapshot(name: str, text: str) -> None:
+    """Assert that text equals the stored snapshot name (rewritten when UPDATE_SNAPSHOTS is set)."""
+    path = os.path.join(SNAPSHOT_DIR, name)
+    if os.getenv("UPDATE_SNAPSHOTS"):
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    
+    with open(path, encoding="utf-8") as f:
+        assert text == f.read(), f"{name} differs from its snapshot (UPDATE_SNAPSHOTS=1 to accept)"
+
+@functools.lru_cache(maxsize=None)
+def _help_text(command: click.Command) -> str:
+    """Render a command's --help text once per session."""
+    return command.get_help(click.Context(command, info_name=command.name))
+
+def test_codex_cli_help():
+    """Test the Codex CLI help command."""
+    # Fixed width so the wrapped help text doesn't depend on the terminal
+    result = runner.invoke(codex, ["--help"], prog_name="oci-genai", terminal_width=80)
+    
+    assert result.exit_code == 0
+    _assert_snapshot("codex_help.txt", result.output)
+
+def test_codex_cli_one_shot_demo():
+    """Test one-shot demo mode."""
+    result = runner.invoke(codex, ["--demo", "--one-shot", "test command", "--mode", "code"])
+    
+    assert result.exit_code == 0
+    assert "Running in demo mode" in result.output
+    assert "```python" in result.output
+
+def test_codex_cli_import_is_lightweight():
+    """Test that importing the Codex CLI does not load litellm."""
+    result = _run_cli((
+        sys.executable, "-c",
+        "import sys, oci_genai_chatbot.codex_cli; "
+        "print('litellm' in sys.modules, 'oci_genai_chatbot.litellm_client' in sys.modules)"
+    ))
+    
+    assert result.returncode == 0
+    assert result.stdout.split() == ["False", "False"]
+
+def test_script_entry_points():
+    """Test that the script entry points are properly configured."""
+    # Load the commands the installed console scripts point at; their help
+    # text is only rendered once per command
+    scripts = entry_points(group="console_scripts")
+    
+    # Test oci-genai command
+    assert scripts["oci-genai"].load() is codex
+    assert "oci-genai - Codex-inspired AI coding assistant" in _help_text(codex)
+    
+    # Test chatbot-cli command  
+    assert scripts["chatbot-cli"].load() is chatbot_cli
+    assert "OCI GenAI Chatbot - Powered by LiteLLM" in _help_text(chatbot_cli)
+
+def test_codex_interface_import():
+    """Test importing the CodexInterface class."""
+    # Test creating interface
+    interface = CodexInterface(demo=True)
+    assert interface.demo == True
+    assert interface.mode == "suggest"
+    assert "suggest" in interface.system_prompts
+
+def test_history_autosaver():
+    """Test that recorded turns are appended to the JSONL history file."""
+    import json
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history", "history.jsonl")
+        
+        interface = CodexInterface(demo=True, mode="code")
+        interface._autosaver = _HistoryAutosaver(path)
+        interface._autosaver.start()
+        
+        interface.record_turn("first", "one")
+        interface.record_turn("second", "two")
+        interface._autosaver.close()
+        
+        with open(path) as f:
+            entries = [json.loads(line) for line in f]
+    
+    assert [e["prompt"] for e in entries] == ["first", "second"]
+    assert entries[0]["mode"] == "code"
+    assert len(interface.session_history) == 2
+
+@pytest.mark.parametrize("code, language", [
+    ("def greet():\n    pass", "python"),
+    ("from os import path", "python"),
+    ("const x = 1;", "javascript"),
+    ("SELECT name FROM users;", "sql"),
+    ("echo hello", "text"),
+])
+def test_guess_language(code, language):
+    """Test that untagged code blocks are recognised by their first keyword."""
+    assert _guess_language(code) == language
+
+def _rendered(response: str):
+    """Return what format_response() prints for response: ("markdown", text) or (lexer, code)."""
+    from rich.syntax import Syntax
+    
+    with patch.object(codex_cli, "console") as console:
+        CodexInterface(demo=True).format_response(response)
+    
+    out = []
+    for call in console.print.call_args_list:
+        item = call.args[0]
+        if isinstance(item, Syntax):
+            out.append((item.lexer.aliases[0], item.code.strip("\n")))
+        else:
+            out.append(("markdown", item.markup))
+    return out
+
+@pytest.mark.parametrize("response, expected", [
+    # Unfenced
+    ("Just prose.", [("markdown", "Just prose.")]),
+    # Language hint, with prose around the block
+    ("Try:\n```js\nlet x = 1;\n```\nDone.",
+     [("markdown", "Try:\n"), ("javascript", "let x = 1;"), ("markdown", "\nDone.")]),
+    # No hint: the language is guessed from the body
+    ("```\nimport os\n```", [("python", "import os")]),
+    # One-line fences are all body, not a language tag
+    ("```x```", [("text", "x")]),
+    ("Run ```select 1 from t``` now", [("markdown", "Run "), ("sql", "select 1 from t"), ("markdown", " now")]),
+])
+def test_format_response(response, expected):
+    """Test that fenced blocks are rendered as code and the rest as Markdown."""
+    assert _rendered(response) == expected
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for the embedding cache.
+"""
+
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from oci_genai_chatbot.embedding_cache import EmbeddingCache
+
+MODEL = "cohere.embed-multilingual-v3.0"
+
+def test_memory_lru_eviction():
+    """Test that the in-memory tier evicts the least recently used entry."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbeddingCache(cache_dir=tmp, max_memory_items=2)
+        cache.put(MODEL, "a", [1.0])
+        cache.put(MODEL, "b", [2.0])
+        cache.get(MODEL, "a")          # "a" is now the most recently used
+        cache.put(MODEL, "c", [3.0])   # evicts "b" from memory
+        
+        assert cache.stats()["memory_items"] == 2
+        assert EmbeddingCache.key(MODEL, "b") not in cache._memory
+        assert EmbeddingCache.key(MODEL, "a") in cache._memory
+
+def test_disk_tier_survives_restart():
+    """Test that embeddings are read back from disk by a new cache instance."""
+    with tempfile.TemporaryDirectory() as tmp:
+        EmbeddingCache(cache_dir=tmp).put(MODEL, "hello", [0.5, 0.25])
+        
+        cache = EmbeddingCache(cache_dir=tmp)
+        assert cache.get(MODEL, "hello") == [0.5, 0.25]
+        assert cache.get(MODEL, "other") is None
+        assert cache.get("another-model", "hello") is None
+        
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        assert stats["disk_items"] == 1
+
+def test_shared_between_threads():
+    """Test that concurrent gets and puts keep the LRU and counters consistent."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbeddingCache(cache_dir=tmp, max_memory_items=4)
+        texts = [f"text {i}" for i in range(8)]
+        for i, text in enumerate(texts):
+            cache.put(MODEL, text, [float(i)])
+        
+        def worker(n):
+            for i in range(200):
+                text = texts[(n + i) % len(texts)]
+                assert cache.get(MODEL, text) == [float(texts.index(text))]
+                cache.put(MODEL, text, [float(texts.index(text))])
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+        
+        assert (cache.hits, cache.misses) == (1600, 0)
+        assert len(cache._memory) == 4
+
+def test_counters_persist_across_instances():
+    """Test that flushed hit/miss counters are reported as lifetime totals by a new instance."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbeddingCache(cache_dir=tmp)
+        cache.put(MODEL, "hello", [0.5])
+        cache.get(MODEL, "hello")
+        cache.get(MODEL, "other")
+        cache.flush()
+        cache.get(MODEL, "hello")
+        cache.flush()
+        cache.flush()                  # nothing new to add
+        
+        stats = EmbeddingCache(cache_dir=tmp).stats()
+        assert (stats["hits"], stats["misses"]) == (0, 0)
+        assert (stats["total_hits"], stats["total_misses"]) == (2, 1)
+        assert stats["disk_items"] == 1
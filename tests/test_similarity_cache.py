@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test script for the similarity cache.
+"""
+
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+
+from oci_genai_chatbot import similarity_cache
+from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
+from oci_genai_chatbot.similarity_cache import SimilarityCache
+
+needs_hnswlib = pytest.mark.skipif(similarity_cache.hnswlib is None, reason="hnswlib not installed")
+
+@needs_hnswlib
+def test_threshold_hit_and_miss():
+    """Test that only prompts at least `threshold` similar are answered from the cache."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SimilarityCache(threshold=0.95, cache_dir=tmp)
+        assert cache.lookup([1.0, 0.0]) is None
+
+        cache.add([1.0, 0.0], "east")
+        assert cache.lookup([1.0, 0.0]) == "east"
+        assert cache.lookup([1.0, 0.1]) == "east"   # cosine ~0.995
+        assert cache.lookup([1.0, 1.0]) is None     # cosine ~0.707
+        assert cache.lookup([0.0, 1.0]) is None
+
+@needs_hnswlib
+def test_scopes_are_isolated():
+    """Test that an entry is only found in the scope it was added under."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SimilarityCache(threshold=0.95, cache_dir=tmp)
+        cache.add([1.0, 0.0], "brief", scope="Be brief.")
+        cache.add([1.0, 0.0], "default")
+
+        assert cache.lookup([1.0, 0.0], scope="Be brief.") == "brief"
+        assert cache.lookup([1.0, 0.0]) == "default"
+        assert cache.lookup([1.0, 0.0], scope="Be verbose.") is None
+
+@needs_hnswlib
+def test_reload_from_disk():
+    """Test that entries are persisted in batches and on flush(), then reloaded."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SimilarityCache(threshold=0.95, cache_dir=tmp, save_every=2)
+        cache.add([1.0, 0.0], "east", scope="s")
+        assert SimilarityCache(threshold=0.95, cache_dir=tmp).lookup([1.0, 0.0], scope="s") is None
+
+        cache.add([0.0, 1.0], "north", scope="s")   # second add writes the batch
+        cache.add([-1.0, 0.0], "west", scope="s")
+        reloaded = SimilarityCache(threshold=0.95, cache_dir=tmp)
+        assert reloaded.lookup([0.0, 1.0], scope="s") == "north"
+        assert reloaded.lookup([-1.0, 0.0], scope="s") is None
+
+        cache.flush()
+        reloaded = SimilarityCache(threshold=0.95, cache_dir=tmp)
+        assert reloaded.lookup([-1.0, 0.0], scope="s") == "west"
+        assert reloaded.lookup([-1.0, 0.0], scope="other") is None
+
+def test_dimension_mismatch_misses():
+    """Test that a vector of another dimension misses instead of reaching the index."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SimilarityCache(threshold=0.95, cache_dir=tmp)
+        cache.add([1.0, 0.0], "east")
+        assert cache.lookup([1.0, 0.0, 0.0]) is None
+
+        # Entries of another embedding model are replaced, not mixed in
+        cache.add([0.0, 0.0, 1.0], "up")
+        assert cache.lookup([0.0, 0.0, 1.0]) == "up"
+        assert cache.lookup([1.0, 0.0]) is None
+
+@pytest.mark.usefixtures("mock_heavy_deps")
+def test_chat_answers_from_cache():
+    """Test that chat() reuses a cached response only under the same settings and history."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+            bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False, sim_cache_threshold=0.95)
+        bot.similarity_cache = SimilarityCache(threshold=0.95, cache_dir=tmp)
+
+        with patch.object(bot, 'embedding', return_value=[1.0, 0.0]), \
+             patch.object(bot._router, 'completion') as mock_completion:
+            mock_completion.return_value = Mock(choices=[Mock(message=Mock(content="Hi"))])
+            assert bot.chat("Hello") == "Hi"
+            bot.reset_conversation()
+            assert bot.chat("Hello!") == "Hi"
+            assert mock_completion.call_count == 1
+            assert [m["content"] for m in bot.get_conversation_history()] == ["Hello!", "Hi"]
+
+            # A follow-up depends on the conversation it is asked in
+            assert bot.chat("Hello") == "Hi"
+            assert mock_completion.call_count == 2
+
+            # Another temperature or system prompt is another scope
+            bot.reset_conversation()
+            bot.temperature = 0.2
+            bot.chat("Hello")
+            bot.reset_conversation()
+            bot.chat("Hello", system_prompt="Be brief.")
+            assert mock_completion.call_count == 4
+
+@pytest.fixture
+def no_hnswlib(monkeypatch):
+    """Force the in-memory brute-force index, as when hnswlib is not installed."""
+    monkeypatch.setattr(similarity_cache, "hnswlib", None)
+
+@pytest.mark.usefixtures("no_hnswlib")
+def test_flat_index_evicts_oldest():
+    """Test that each scope keeps only its max_memory_entries most recent prompts."""
+    cache = SimilarityCache(threshold=0.95, max_memory_entries=2)
+    cache.add([1.0, 0.0], "east")
+    cache.add([0.0, 1.0], "north")
+    cache.add([-1.0, 0.0], "west")      # overwrites "east"
+    
+    assert cache.lookup([1.0, 0.0]) is None
+    assert cache.lookup([0.0, 1.0]) == "north"
+    assert cache.lookup([-1.0, 0.0]) == "west"
+    
+    cache.add([0.0, -1.0], "south")     # overwrites "north"
+    assert cache.lookup([0.0, 1.0]) is None
+    assert cache.lookup([0.0, -1.0]) == "south"
+
+@pytest.mark.usefixtures("no_hnswlib")
+def test_flat_index_zero_norm_vectors():
+    """Test that zero vectors are never stored and never match."""
+    cache = SimilarityCache(threshold=0.0)
+    cache.add([0.0, 0.0], "zero")
+    assert cache._flat == {}
+    assert cache.lookup([1.0, 0.0]) is None
+    
+    cache.add([1.0, 0.0], "east")
+    assert cache.lookup([0.0, 0.0]) is None
+    assert cache.lookup([3.0, 0.0]) == "east"   # similarity ignores magnitude
+
+@pytest.mark.usefixtures("no_hnswlib")
+def test_flat_index_scopes_are_separate():
+    """Test that each scope has its own index and eviction."""
+    cache = SimilarityCache(threshold=0.95, max_memory_entries=1)
+    cache.add([1.0, 0.0], "brief", scope="Be brief.")
+    cache.add([1.0, 0.0], "default")
+    cache.add([0.0, 1.0], "other")      # evicts only from the default scope
+    
+    assert cache.lookup([1.0, 0.0], scope="Be brief.") == "brief"
+    assert cache.lookup([1.0, 0.0]) is None
+    assert cache.lookup([0.0, 1.0], scope="Be brief.") is None
+    assert cache.lookup([0.0, 1.0], scope="Be verbose.") is None
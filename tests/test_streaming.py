@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Test script for OCI GenAI Chatbot streaming functionality.
+"""
+
+import os
+import subprocess
+import sys
+from collections import namedtuple
+from unittest.mock import Mock, patch
+
+import pytest
+
+# litellm and oci are only imported when a bot is created, so the module can
+# be imported before the mocks are installed
+from oci_genai_chatbot.litellm_client import OCIGenAIChatBot
+
+# Mock the dependencies since we don't have them installed
+pytestmark = pytest.mark.usefixtures("mock_heavy_deps")
+
+# Plain stand-ins for LiteLLM's streaming chunk objects
+Delta = namedtuple("Delta", "content")
+Choice = namedtuple("Choice", "delta finish_reason")
+Chunk = namedtuple("Chunk", "choices")
+
+def test_streaming_methods_exist():
+    """Test that streaming methods exist on the chatbot class."""
+    # Check that streaming methods exist
+    assert hasattr(OCIGenAIChatBot, 'chat_stream')
+    assert hasattr(OCIGenAIChatBot, 'achat')
+    assert hasattr(OCIGenAIChatBot, 'achat_stream')
+    assert hasattr(OCIGenAIChatBot, '_process_streaming_response')
+    assert hasattr(OCIGenAIChatBot, '_process_async_streaming_response')
+
+def test_streaming_signature():
+    """Test that chat method supports streaming parameter."""
+    import inspect
+    for method in (OCIGenAIChatBot.chat, OCIGenAIChatBot.achat):
+        stream = inspect.signature(method).parameters['stream']
+        assert stream.default is False
+        assert stream.annotation is bool
+    
+    # The response processors are (async) generators
+    assert inspect.isgeneratorfunction(OCIGenAIChatBot._process_streaming_response)
+    assert inspect.isasyncgenfunction(OCIGenAIChatBot._process_async_streaming_response)
+    assert inspect.iscoroutinefunction(OCIGenAIChatBot.achat_stream)
+
+def test_mock_streaming_response():
+    """Test streaming response processing with mock data."""
+    # Chunk data that simulates LiteLLM streaming response
+    mock_chunks = [
+        Chunk([Choice(Delta("Hello"), None)]),
+        Chunk([Choice(Delta(" there!"), None)]),
+        Chunk([Choice(Delta(" How"), None)]),
+        Chunk([Choice(Delta(" are you?"), "stop")]),
+    ]
+    
+    # This would normally require OCI config, so skip the validation
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False)
+    
+    # Test the streaming response processor
+    collected_text = "".join(bot._process_streaming_response(iter(mock_chunks), "test message"))
+    
+    assert collected_text == "Hello there! How are you?"
+
+def test_chat_stream_yields_deltas():
+    """Test that chat(stream=True) streams deltas from the litellm router."""
+    mock_chunks = [
+        Mock(choices=[Mock(delta=Mock(content="Hello"), finish_reason=None)]),
+        Mock(choices=[Mock(delta=Mock(content=None), finish_reason=None)]),
+        Mock(choices=[Mock(delta=Mock(content=" there!"), finish_reason="stop")]),
+    ]
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        # Disable batching so each delta is yielded as it arrives
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False, stream_batch_ms=0)
+    
+    with patch.object(bot._router, 'completion') as mock_completion:
+        mock_completion.return_value = iter(mock_chunks)
+        
+        chunks = list(bot.chat("Hi", system_prompt="Be brief.", stream=True))
+        
+        assert mock_completion.call_args.kwargs["stream"] is True
+        assert chunks == ["Hello", " there!"]
+        assert bot.get_conversation_history() == (
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello there!"},
+        )
+
+def test_stream_batching():
+    """Test that streamed deltas are coalesced into batches."""
+    mock_chunks = [
+        Mock(choices=[Mock(delta=Mock(content=text), finish_reason=None)])
+        for text in ["a", "b", "c", "d", "e"]
+    ]
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False,
+                              stream_batch_ms=60_000, stream_batch_tokens=2)
+    
+    chunks = list(bot._process_streaming_response(iter(mock_chunks), "test message"))
+    
+    assert chunks == ["ab", "cd", "e"]
+    assert bot.get_conversation_history()[-1]["content"] == "abcde"
+
+def test_embedding_batch_splits_requests():
+    """Test that embedding_batch sends at most batch_size texts per request."""
+    def fake_embedding(model, input, compartment_id):
+        return Mock(data=[Mock(embedding=[float(len(text))]) for text in input])
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False)
+    
+    texts = ["x" * n for n in range(1, 201)]
+    with patch('oci_genai_chatbot.litellm_client.litellm.embedding',
+               side_effect=fake_embedding) as mock_embedding:
+        embeddings = bot.embedding_batch(texts)
+        single = bot.embedding("hello")
+    
+    assert [len(call.kwargs["input"]) for call in mock_embedding.call_args_list] == [96, 96, 8, 1]
+    assert embeddings == [[float(n)] for n in range(1, 201)]
+    assert single == [5.0]
+
+def test_stream_skips_empty_deltas():
+    """Test that None/empty deltas are skipped and content on the final chunk is kept."""
+    mock_chunks = [
+        Mock(choices=[]),
+        Mock(choices=[Mock(delta=Mock(content=None), finish_reason=None)]),
+        Mock(choices=[Mock(delta=Mock(content=""), finish_reason=None)]),
+        Mock(choices=[Mock(delta=Mock(spec=[]), finish_reason=None)]),
+        Mock(choices=[Mock(delta=Mock(content="Hi"), finish_reason=None)]),
+        Mock(choices=[Mock(delta=Mock(content="!"), finish_reason="stop")]),
+        Mock(choices=[Mock(delta=Mock(content="ignored"), finish_reason=None)]),
+    ]
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False, stream_batch_ms=0)
+    
+    chunks = list(bot._process_streaming_response(iter(mock_chunks), "test message"))
+    
+    assert chunks == ["Hi", "!"]
+    assert bot.get_conversation_history()[-1]["content"] == "Hi!"
+
+def test_conversation_history_is_bounded():
+    """Test that history keeps only the last 10 exchanges."""
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False)
+    
+    with patch.object(bot._router, 'completion') as mock_completion:
+        for i in range(12):
+            mock_completion.return_value = Mock(choices=[Mock(message=Mock(content=f"reply {i}"))])
+            bot.chat(f"message {i}", system_prompt="Be brief.")
+        
+        history = bot.get_conversation_history()
+        assert len(history) == 20
+        assert history[0] == {"role": "user", "content": "message 2"}
+        assert history[-1] == {"role": "assistant", "content": "reply 11"}
+        
+        # The system message stays first in the request
+        sent = mock_completion.call_args.kwargs["messages"]
+        assert sent[0] == {"role": "system", "content": "Be brief."}
+        
+        bot.reset_conversation()
+        assert bot.get_conversation_history() == ()
+
+def test_chat_sends_fresh_message_list():
+    """Test that chat() and achat() send fresh message lists built from the history."""
+    import asyncio
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False)
+    
+    with patch.object(bot._router, 'completion') as mock_completion:
+        mock_completion.return_value = Mock(choices=[Mock(message=Mock(content="first reply"))])
+        bot.chat("first", system_prompt="Be brief.")
+        sent_first = mock_completion.call_args.kwargs["messages"]
+        bot.chat("second")
+    
+    # The payload litellm received is not rewritten by later turns
+    assert [m["content"] for m in sent_first] == ["Be brief.", "first"]
+    
+    # Concurrent achat calls must each send only their own new message
+    sent = []
+    
+    async def fake_acompletion(**kwargs):
+        sent.append([m["content"] for m in kwargs["messages"]])
+        await asyncio.sleep(0)
+        return Mock(choices=[Mock(message=Mock(content="reply"))])
+    
+    async def ask_both():
+        return await asyncio.gather(bot.achat("a", "Be brief."), bot.achat("b", "Be brief."))
+    
+    with patch.object(bot._router, 'acompletion', side_effect=fake_acompletion):
+        asyncio.run(ask_both())
+    
+    assert sent == [
+        ["Be brief.", "first", "first reply", "second", "first reply", "a"],
+        ["Be brief.", "first", "first reply", "second", "first reply", "b"],
+    ]
+    assert [m["content"] for m in bot.get_conversation_history()] == [
+        "first", "first reply", "second", "first reply", "a", "reply", "b", "reply"
+    ]
+
+def test_achat_records_history():
+    """Test that achat() records exchanges in the bounded history, streamed or not."""
+    import asyncio
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False, stream_batch_ms=0)
+    
+    async def fake_acompletion(**kwargs):
+        if kwargs["stream"]:
+            async def chunks():
+                yield Mock(choices=[Mock(delta=Mock(content="streamed reply"), finish_reason="stop")])
+            return chunks()
+        return Mock(choices=[Mock(message=Mock(content="reply"))])
+    
+    async def run():
+        for i in range(10):
+            await bot.achat(f"message {i}")
+        stream = await bot.achat("last", stream=True)
+        return [chunk async for chunk in stream]
+    
+    with patch.object(bot._router, 'acompletion', side_effect=fake_acompletion):
+        assert asyncio.run(run()) == ["streamed reply"]
+    
+    history = bot.get_conversation_history()
+    assert len(history) == 20
+    assert history[0] == {"role": "user", "content": "message 1"}
+    assert history[-1] == {"role": "assistant", "content": "streamed reply"}
+
+def _tracking_acompletion(counts):
+    """Return a fake acompletion that counts requests in flight, streams included."""
+    import asyncio
+    
+    async def fake_acompletion(**kwargs):
+        counts["active"] += 1
+        counts["peak"] = max(counts["peak"], counts["active"])
+        if not kwargs["stream"]:
+            await asyncio.sleep(0.01)
+            counts["active"] -= 1
+            return Mock(choices=[Mock(message=Mock(content="reply"))])
+        
+        async def chunks():
+            try:
+                await asyncio.sleep(0.01)
+                yield Chunk([Choice(Delta("hi"), "stop")])
+            finally:
+                counts["active"] -= 1
+        return chunks()
+    
+    return fake_acompletion
+
+def test_achat_inflight_limit():
+    """Test that achat() bounds concurrent requests, including open streams."""
+    import asyncio
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False,
+                              stream_batch_ms=0, inflight_limit=2)
+    
+    counts = {"active": 0, "peak": 0}
+    
+    async def consume(i):
+        stream = await bot.achat(f"streamed {i}", stream=True)
+        return [chunk async for chunk in stream]
+    
+    async def run():
+        return await asyncio.gather(*(bot.achat(str(i)) for i in range(3)),
+                                    *(consume(i) for i in range(3)))
+    
+    # The bot was built outside any loop; each asyncio.run gets its own limit
+    with patch.object(bot._router, 'acompletion', side_effect=_tracking_acompletion(counts)):
+        for _ in range(2):
+            assert asyncio.run(run()) == ["reply"] * 3 + [["hi"]] * 3
+            assert counts == {"active": 0, "peak": 2}
+
+def test_achat_stream_closed_early_frees_slot():
+    """Test that closing a stream, before or during iteration, frees its in-flight slot."""
+    import asyncio
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False,
+                              stream_batch_ms=0, inflight_limit=1)
+    
+    counts = {"active": 0, "peak": 0}
+    
+    async def run():
+        # Closed before the first iteration
+        stream = await bot.achat("a", stream=True)
+        await stream.aclose()
+        
+        # Closed after the request was made but before the stream finished
+        stream = await bot.achat("b", stream=True)
+        await stream.__anext__()
+        await stream.aclose()
+        
+        return await asyncio.wait_for(bot.achat("c"), timeout=1)
+    
+    with patch.object(bot._router, 'acompletion', side_effect=_tracking_acompletion(counts)):
+        assert asyncio.run(run()) == "reply"
+    
+    assert counts == {"active": 0, "peak": 1}
+
+def test_achat_timeout():
+    """Test that the router owns the timeout and the retry, and achat() only adds a deadline."""
+    import asyncio
+    
+    with patch.object(OCIGenAIChatBot, '_validate_oci_setup'):
+        bot = OCIGenAIChatBot(compartment_id="test", cache_embeddings=False, request_timeout=0.05)
+    
+    router_kwargs = sys.modules["litellm"].Router.call_args.kwargs
+    assert (router_kwargs["timeout"], router_kwargs["num_retries"]) == (0.05, 1)
+    
+    calls = 0
+    
+    async def hang(**kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(10)
+    
+    with patch.object(bot._router, 'acompletion', side_effect=hang):
+        assert asyncio.run(bot.achat("hello")) == "Error: no response after 0.1s"
+    assert calls == 1
+
+def test_litellm_is_imported_lazily():
+    """Test that importing the client module does not load litellm."""
+    result = subprocess.run([
+        sys.executable, "-c",
+        "import sys, oci_genai_chatbot.litellm_client; print('litellm' in sys.modules)"
+    ], capture_output=True, text=True, cwd=os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+    
+    assert result.returncode == 0
+    assert result.stdout.split() == ["False"]
+
+def test_return_types():
+    """Test that methods return correct types."""
+    import inspect
+    from typing import get_type_hints
+    
+    # Check chat method return type
+    hints = get_type_hints(OCIGenAIChatBot.chat)
+    assert 'return' in hints
+    
+    # Check chat_stream method return type
+    hints = get_type_hints(OCIGenAIChatBot.chat_stream)
+    assert 'return' in hints
+    
+    # Check achat method return type
+    hints = get_type_hints(OCIGenAIChatBot.achat)
+    assert 'return' in hints
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Simple test to verify chatbot streaming implementation structure.
+"""
+
+import functools
+import os
+import re
+from types import MappingProxyType
+from typing import FrozenSet, Set
+
+import pytest
+
+@functools.lru_cache(maxsize=None)
+def _needle_pattern(needles: FrozenSet[str]) -> "re.Pattern[str]":
+    """
+    Compile, once per needle set, a pattern that finds every needle in one scan.
+    
+    The alternation sits in a lookahead so overlapping needles (e.g.
+    "for chunk in ..." inside "async for chunk in ...") are all seen; longer
+    needles are tried first at each position.
+    """
+    alternatives = "|".join(re.escape(n) for n in sorted(needles, key=len, reverse=True))
+    return re.compile(f"(?=({alternatives}))")
+
+def _find_all(content: str, needles: FrozenSet[str]) -> Set[str]:
+    """Return the needles that occur in content."""
+    return set(_needle_pattern(needles).findall(content))
+
+# Streaming-related features in streamlit_app.py
+STREAMLIT_APP_FEATURES = MappingProxyType({
+    '"enable_streaming"': 'Streaming configuration option',
+    'Enable Streaming': 'Streaming toggle in UI',
+    'chat_stream(': 'Streaming method usage',
+    'st.write_stream': 'Streaming response rendering',
+    'full_response = st.write_stream': 'Streamed response collection',
+    'stream_generator': 'Streaming generator variable',
+    '[first_chunk], stream_generator': 'Stream iteration in UI',
+    'Streaming:': 'Streaming status display',
+})
+
+# Streaming-related features in cli.py
+CLI_FEATURES = MappingProxyType({
+    '--stream/--no-stream': 'CLI streaming option',
+    'default=True': 'Streaming enabled by default',
+    'help="Enable/disable streaming responses"': 'Streaming help text',
+    'if stream:': 'Streaming conditional logic',
+    'response_generator = bot.chat': 'Streaming response handling',
+    'for chunk in response_generator': 'CLI stream iteration',
+    'out.write(chunk)': 'Real-time chunk output',
+    'Streaming mode: responses will appear in real-time': 'Streaming mode help',
+})
+
+# Streaming documentation in README.md
+README_DOCS = MappingProxyType({
+    'Real-time Streaming': 'Streaming feature highlight',
+    '--stream': 'CLI streaming option documentation',
+    '--no-stream': 'CLI non-streaming option documentation',
+    'chat_stream': 'Streaming method documentation',
+    'achat_stream': 'Async streaming method documentation',
+    'stream=True': 'LiteLLM streaming parameter',
+    'Real-time streaming': 'Streaming feature description',
+    'Streaming Toggle': 'UI streaming toggle documentation',
+    'async for chunk': 'Async streaming example',
+})
+
+def _case(path, features, **kwargs):
+    """Build a test case; the feature keys are frozen once so their compiled pattern is cached."""
+    return pytest.param(path, features, frozenset(features), id=os.path.basename(path), **kwargs)
+
+# (path, features, needles); file contents come from the file_sources fixture in
+# conftest.py. The chatbot class itself is checked by introspection in test_streaming.py.
+STRUCTURE_CASES = [
+    _case("src/oci_genai_chatbot/streamlit_app.py", STREAMLIT_APP_FEATURES),
+    _case("src/oci_genai_chatbot/cli.py", CLI_FEATURES),
+    _case("README.md", README_DOCS, marks=pytest.mark.skip(
+        reason="README.md only points to the example's new home in the LiteLLM repo")),
+]
+
+@pytest.mark.parametrize("path,features,needles", STRUCTURE_CASES)
+def test_contains_streaming_features(path, features, needles, file_sources):
+    """Test that a source file has all of its streaming features."""
+    content = file_sources[path]
+    
+    found = _find_all(content, needles)
+    missing = [description for feature, description in features.items() if feature not in found]
+    
+    assert not missing, "Missing features:\n" + "\n".join(f"  ✗ {d}" for d in missing)